@@ -0,0 +1,121 @@
+"""In-process TTL cache for upstream responses."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any, Optional
+
+from app.logger import get_logger
+
+# Get logger instance
+logger = get_logger("cache")
+
+# Time-to-live values in seconds
+DETAILS_TTL = 24 * 60 * 60
+SEARCH_TTL = 10 * 60
+URL_FOUND_TTL = 60 * 60
+URL_MISSING_TTL = 10 * 60
+SERIES_AVAILABILITY_TTL = 30 * 60
+
+# Entries older than this fraction of their TTL are refreshed in the background
+REFRESH_RATIO = 0.8
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a per-entry TTL.
+
+    Concurrent misses on the same key share a single fetch (single-flight).
+    Hits on entries close to expiry are served immediately while one
+    background fetch refreshes them (stale-while-revalidate). Failed fetches
+    are never stored, so errors always reach the caller.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize an empty cache holding at most ``maxsize`` entries."""
+        self.maxsize = maxsize
+        # key -> (value, stored_at, ttl); ordered from least to most recent
+        self._entries: OrderedDict[str, tuple[Any, float, float]] = OrderedDict()
+        # key -> fetch currently filling that key
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at, ttl = entry
+        if time.monotonic() - stored_at >= ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (value, time.monotonic(), ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_set(
+        self, key: str, fetcher: Callable[[], Awaitable[Any]], ttl: float
+    ) -> Any:
+        """Get a cached value, calling ``fetcher`` to fill it on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at, entry_ttl = entry
+            age = time.monotonic() - stored_at
+            if age < entry_ttl:
+                self._entries.move_to_end(key)
+                if age > entry_ttl * REFRESH_RATIO and key not in self._inflight:
+                    task = self._start_fill(key, fetcher, ttl)
+                    task.add_done_callback(partial(self._log_refresh_failure, key))
+                return value
+            del self._entries[key]
+
+        task = self._inflight.get(key) or self._start_fill(key, fetcher, ttl)
+        # Shielded so one cancelled caller does not abort the others' fetch
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    def _start_fill(
+        self, key: str, fetcher: Callable[[], Awaitable[Any]], ttl: float
+    ) -> asyncio.Task:
+        """Start fetching ``key`` and register the fetch for later callers."""
+        task = asyncio.create_task(self._fill(key, fetcher, ttl))
+        self._inflight[key] = task
+        return task
+
+    async def _fill(
+        self, key: str, fetcher: Callable[[], Awaitable[Any]], ttl: float
+    ) -> Any:
+        """Fetch and store a fresh value for ``key``."""
+        try:
+            value = await fetcher()
+            self.set(key, value, ttl)
+            return value
+        finally:
+            del self._inflight[key]
+
+    @staticmethod
+    def _log_refresh_failure(key: str, task: asyncio.Task) -> None:
+        """Log a failed background refresh; the stale value stays cached."""
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.warning(
+            "Background refresh failed for cache key %s",
+            key,
+            extra_fields={"cache_key": key, "error": str(task.exception())},
+        )
+
+
+# Shared cache for TMDB search pages and details
+tmdb_cache = TTLCache(maxsize=4096)
+
+# Shared cache for vixsrc URL probes and per-series availability
+availability_cache = TTLCache(maxsize=100_000)
@@ -1,42 +1,87 @@
 """Error management system for StreamPortal API."""
 
+import logging
+from functools import lru_cache
 from typing import Any, Optional, Union
 
+import orjson
 from fastapi import HTTPException
+from fastapi.responses import JSONResponse, Response
 
 from .logger import get_logger
 
+__all__ = [
+    "MAX_SEARCH_QUERY_LENGTH",
+    "MIN_SEARCH_QUERY_LENGTH",
+    "AuthenticationError",
+    "ExternalAPIError",
+    "NotFoundError",
+    "RateLimitError",
+    "StreamPortalError",
+    "StreamingAvailabilityError",
+    "ValidationError",
+    "create_http_exception",
+    "generic_error_body",
+    "handle_generic_exception",
+    "handle_streamportal_error",
+    "log_api_error",
+    "log_api_request",
+    "streamportal_error_body",
+    "streamportal_error_response",
+    "validate_api_key",
+]
+
 logger = get_logger("errors")
 
+# Search query length limits, enforced by the request models
+MIN_SEARCH_QUERY_LENGTH = 2
+MAX_SEARCH_QUERY_LENGTH = 100
+
 
 class StreamPortalError(Exception):
-    """Base exception for StreamPortal API."""
+    """Base exception for StreamPortal API.
+
+    Subclasses declare their ``error_code`` and ``status_code`` as class
+    attributes, so constructing an error only stores the message and details.
+    """
+
+    __slots__ = ("details", "message")
+
+    error_code = "INTERNAL_ERROR"
+    status_code = 500
 
     def __init__(
         self,
         message: str,
-        error_code: str = "INTERNAL_ERROR",
-        status_code: int = 500,
+        error_code: Optional[str] = None,
+        status_code: Optional[int] = None,
         details: Optional[dict[str, Any]] = None,
     ) -> None:
         """Initialize StreamPortalError.
 
         Args:
             message: Error message
-            error_code: Error code identifier
-            status_code: HTTP status code
+            error_code: Error code identifier, overriding the class default
+            status_code: HTTP status code, overriding the class default
             details: Additional error details
         """
         self.message = message
-        self.error_code = error_code
-        self.status_code = status_code
         self.details = details or {}
-        super().__init__(self.message)
+        if error_code is not None:
+            self.error_code = error_code
+        if status_code is not None:
+            self.status_code = status_code
+        super().__init__(message)
 
 
 class ValidationError(StreamPortalError):
     """Validation error for invalid input data."""
 
+    __slots__ = ()
+
+    error_code = "VALIDATION_ERROR"
+    status_code = 400
+
     def __init__(
         self,
         message: str,
@@ -50,17 +95,21 @@ class ValidationError(StreamPortalError):
             field: Field that failed validation
             details: Additional validation details
         """
-        super().__init__(
-            message=message,
-            error_code="VALIDATION_ERROR",
-            status_code=400,
-            details={"field": field, **(details or {})},
-        )
+        if details:
+            details = {"field": field, **details}
+        else:
+            details = {"field": field}
+        super().__init__(message, details=details)
 
 
 class AuthenticationError(StreamPortalError):
     """Authentication error for API key issues."""
 
+    __slots__ = ()
+
+    error_code = "AUTHENTICATION_ERROR"
+    status_code = 401
+
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -72,17 +121,17 @@ class AuthenticationError(StreamPortalError):
             message: Error message
             details: Additional authentication details
         """
-        super().__init__(
-            message=message,
-            error_code="AUTHENTICATION_ERROR",
-            status_code=401,
-            details=details or {},
-        )
+        super().__init__(message, details=details)
 
 
 class RateLimitError(StreamPortalError):
     """Rate limiting error."""
 
+    __slots__ = ()
+
+    error_code = "RATE_LIMIT_ERROR"
+    status_code = 429
+
     def __init__(
         self, message: str = "Rate limit exceeded", retry_after: int = 60
     ) -> None:
@@ -92,36 +141,40 @@ class RateLimitError(StreamPortalError):
             message: Error message
             retry_after: Seconds to wait before retrying
         """
-        super().__init__(
-            message=message,
-            error_code="RATE_LIMIT_ERROR",
-            status_code=429,
-            details={"retry_after": retry_after},
-        )
+        super().__init__(message, details={"retry_after": retry_after})
 
 
 class ExternalAPIError(StreamPortalError):
     """Error from external API calls."""
 
-    def __init__(self, message: str, api_name: str, status_code: int = 502) -> None:
+    __slots__ = ()
+
+    error_code = "EXTERNAL_API_ERROR"
+    status_code = 502
+
+    def __init__(
+        self, message: str, api_name: str, status_code: Optional[int] = None
+    ) -> None:
         """Initialize ExternalAPIError.
 
         Args:
             message: Error message
             api_name: Name of the external API
-            status_code: HTTP status code
+            status_code: HTTP status code, defaults to 502
         """
         super().__init__(
-            message=message,
-            error_code="EXTERNAL_API_ERROR",
-            status_code=status_code,
-            details={"api_name": api_name},
+            message, status_code=status_code, details={"api_name": api_name}
         )
 
 
 class NotFoundError(StreamPortalError):
     """Resource not found error."""
 
+    __slots__ = ()
+
+    error_code = "NOT_FOUND_ERROR"
+    status_code = 404
+
     def __init__(
         self,
         message: str,
@@ -136,9 +189,7 @@ class NotFoundError(StreamPortalError):
             resource_id: ID of resource not found
         """
         super().__init__(
-            message=message,
-            error_code="NOT_FOUND_ERROR",
-            status_code=404,
+            message,
             details={"resource_type": resource_type, "resource_id": resource_id},
         )
 
@@ -146,6 +197,11 @@ class NotFoundError(StreamPortalError):
 class StreamingAvailabilityError(StreamPortalError):
     """Error related to streaming availability checks."""
 
+    __slots__ = ()
+
+    error_code = "STREAMING_AVAILABILITY_ERROR"
+    status_code = 503
+
     def __init__(
         self, message: str, content_id: Optional[Union[str, int]] = None
     ) -> None:
@@ -155,17 +211,26 @@ class StreamingAvailabilityError(StreamPortalError):
             message: Error message
             content_id: ID of content with streaming issues
         """
-        super().__init__(
-            message=message,
-            error_code="STREAMING_AVAILABILITY_ERROR",
-            status_code=503,
-            details={"content_id": content_id},
-        )
+        super().__init__(message, details={"content_id": content_id})
 
 
-def handle_streamportal_error(error: StreamPortalError) -> dict[str, Any]:
-    """Convert StreamPortal error to structured response."""
-    error_response = {
+def log_streamportal_error(error: StreamPortalError) -> None:
+    """Log a StreamPortal error with its structured context."""
+    logger.error(
+        "StreamPortal Error: %s - %s",
+        error.error_code,
+        error.message,
+        extra_fields={
+            "error_code": error.error_code,
+            "status_code": error.status_code,
+            "details": error.details,
+        },
+    )
+
+
+def streamportal_error_body(error: StreamPortalError) -> dict[str, Any]:
+    """Build the structured response body for a StreamPortal error."""
+    return {
         "error": {
             "code": error.error_code,
             "message": error.message,
@@ -174,17 +239,50 @@ def handle_streamportal_error(error: StreamPortalError) -> dict[str, Any]:
         }
     }
 
-    # Log the error
-    logger.error(
-        f"StreamPortal Error: {error.error_code} - {error.message}",
-        extra_fields={
-            "error_code": error.error_code,
-            "status_code": error.status_code,
-            "details": error.details,
-        },
+
+def handle_streamportal_error(error: StreamPortalError) -> dict[str, Any]:
+    """Convert StreamPortal error to structured response."""
+    log_streamportal_error(error)
+
+    return streamportal_error_body(error)
+
+
+@lru_cache(maxsize=64)
+def _serialize_error_without_details(
+    error_code: str, status_code: int, message: str
+) -> bytes:
+    """Serialize an error response body that carries no details."""
+    return orjson.dumps(
+        {
+            "error": {
+                "code": error_code,
+                "message": message,
+                "status_code": status_code,
+                "details": {},
+            }
+        }
     )
 
-    return error_response
+
+def streamportal_error_response(error: StreamPortalError) -> Response:
+    """Build the HTTP response for a StreamPortal error.
+
+    Errors without details (e.g. authentication failures) always render to
+    the same body, so it is serialized once and reused.
+    """
+    if error.details:
+        return JSONResponse(
+            status_code=error.status_code, content=handle_streamportal_error(error)
+        )
+
+    log_streamportal_error(error)
+    return Response(
+        content=_serialize_error_without_details(
+            error.error_code, error.status_code, error.message
+        ),
+        status_code=error.status_code,
+        media_type="application/json",
+    )
 
 
 def create_http_exception(error: StreamPortalError) -> HTTPException:
@@ -195,31 +293,49 @@ def create_http_exception(error: StreamPortalError) -> HTTPException:
     )
 
 
-def handle_generic_exception(
-    exception: Exception, context: str = "Unknown"
-) -> dict[str, Any]:
-    """Handle generic exceptions and convert to structured error response."""
-    error_response = {
+def generic_error_body(context: str, exception_type: str) -> dict[str, Any]:
+    """Build the structured response body for an unexpected exception."""
+    return {
         "error": {
             "code": "INTERNAL_ERROR",
             "message": "An unexpected error occurred",
             "status_code": 500,
             "details": {
                 "context": context,
-                "exception_type": type(exception).__name__,
+                "exception_type": exception_type,
             },
         }
     }
 
+
+def handle_generic_exception(
+    exception: Exception,
+    context: str = "Unknown",
+    exception_type: Optional[str] = None,
+) -> dict[str, Any]:
+    """Handle generic exceptions and convert to structured error response.
+
+    Callers that already know the exception's type name can pass it as
+    ``exception_type`` to avoid looking it up again.
+    """
+    if exception_type is None:
+        exception_type = type(exception).__name__
+
+    error_response = generic_error_body(context, exception_type)
+
     # Log the exception with full traceback
-    logger.exception(
-        f"Unexpected error in {context}: {exception!s}",
-        extra_fields={
-            "context": context,
-            "exception_type": type(exception).__name__,
-            "exception_message": str(exception),
-        },
-    )
+    if logger.is_enabled_for(logging.ERROR):
+        exception_message = str(exception)
+        logger.exception(
+            "Unexpected error in %s: %s",
+            context,
+            exception_message,
+            extra_fields={
+                "context": context,
+                "exception_type": exception_type,
+                "exception_message": exception_message,
+            },
+        )
 
     return error_response
 
@@ -233,40 +349,6 @@ def validate_api_key(api_key: str) -> None:
         raise AuthenticationError("Invalid API key format")
 
 
-def validate_search_query(query: str) -> None:
-    """Validate search query."""
-    if not query or not query.strip():
-        raise ValidationError("Search query cannot be empty", field="text_search")
-
-    if len(query.strip()) < 2:
-        raise ValidationError(
-            "Search query must be at least 2 characters long", field="text_search"
-        )
-
-    if len(query) > 100:
-        raise ValidationError(
-            "Search query too long (max 100 characters)", field="text_search"
-        )
-
-
-def validate_content_id(content_id: int) -> None:
-    """Validate content ID."""
-    if not isinstance(content_id, int) or content_id <= 0:
-        raise ValidationError(
-            "Content ID must be a positive integer", field="content_id"
-        )
-
-
-def validate_content_type(content_type: str) -> None:
-    """Validate content type."""
-    allowed_types = ["Movie", "Series"]
-    if content_type not in allowed_types:
-        raise ValidationError(
-            f"Content type must be one of: {', '.join(allowed_types)}",
-            field="type_of_content",
-        )
-
-
 def log_api_request(
     method: str,
     path: str,
@@ -277,7 +359,9 @@ def log_api_request(
 ) -> None:
     """Log API request details."""
     logger.info(
-        f"API Request: {method} {path}",
+        "API Request: %s %s",
+        method,
+        path,
         extra_fields={
             "method": method,
             "path": path,
@@ -297,14 +381,21 @@ def log_api_error(
     user_agent: Optional[str] = None,
 ) -> None:
     """Log API error details."""
+    if not logger.is_enabled_for(logging.ERROR):
+        return
+
+    error_message = str(error)
     logger.error(
-        f"API Error: {method} {path} - {error!s}",
+        "API Error: %s %s - %s",
+        method,
+        path,
+        error_message,
         extra_fields={
             "method": method,
             "path": path,
             "client_ip": client_ip,
             "error_type": type(error).__name__,
-            "error_message": str(error),
+            "error_message": error_message,
             "user_agent": user_agent,
         },
     )
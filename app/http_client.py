@@ -0,0 +1,79 @@
+"""Shared HTTP client session for outgoing requests to TMDB and vixsrc."""
+
+import asyncio
+import random
+from typing import Optional
+
+import aiohttp
+
+# Connection pool shared by every outgoing request
+_session: Optional[aiohttp.ClientSession] = None
+
+# Retry policy for idempotent GETs against upstream APIs
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 4.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Default per-request limits, so a hung upstream cannot hold a pool slot forever
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Get the shared client session, creating it on first use.
+
+    Reusing one session keeps DNS results and keep-alive connections to TMDB
+    and vixsrc across requests instead of paying a new handshake per call.
+    """
+    global _session
+
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+            keepalive_timeout=60,
+        )
+        _session = aiohttp.ClientSession(connector=connector, timeout=REQUEST_TIMEOUT)
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared client session if it was created."""
+    global _session
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+async def get_with_retry(
+    session: aiohttp.ClientSession, url: str, **kwargs
+) -> tuple[int, bytes]:
+    """GET a URL, retrying rate limits, server errors and network failures.
+
+    Retries back off exponentially with full jitter, honouring a numeric
+    ``Retry-After`` header when the upstream sends one. The final attempt's
+    status and body are returned whatever the status; a network error on
+    the final attempt is raised.
+
+    Returns:
+        Tuple of response status and raw body
+    """
+    for attempt in range(RETRY_ATTEMPTS - 1):
+        try:
+            async with session.get(url, **kwargs) as response:
+                if response.status not in RETRY_STATUSES:
+                    return response.status, await response.read()
+                retry_after = response.headers.get("Retry-After")
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            retry_after = None
+
+        delay = random.uniform(0, RETRY_BASE_DELAY * 2**attempt)
+        if retry_after is not None and retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+        await asyncio.sleep(min(delay, RETRY_MAX_DELAY))
+
+    async with session.get(url, **kwargs) as response:
+        return response.status, await response.read()
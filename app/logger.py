@@ -1,13 +1,28 @@
 """Comprehensive logging system for StreamPortal API using uvicorn logger."""
 
-import json
 import logging
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
 
+import orjson
+
+# Allow non-string keys (e.g. season numbers) in structured fields
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _dump_extra_fields(extra_fields: dict[str, Any]) -> str:
+    """Serialize extra structured fields to a JSON string."""
+    return orjson.dumps(extra_fields, option=_ORJSON_OPTIONS).decode()
+
 
 class StreamPortalLogger:
     """Main logger class for StreamPortal API using uvicorn logger."""
 
+    # Every instance writes through uvicorn's logger
+    logger = logging.getLogger("uvicorn.error")
+
     def __init__(self, name: str = "streamportal", log_level: str = "INFO") -> None:
         """Initialize StreamPortalLogger.
 
@@ -17,70 +32,102 @@ class StreamPortalLogger:
         """
         self.name = name
         self.log_level = getattr(logging, log_level.upper())
-
-        # Use uvicorn's logger as base
-        self.logger = logging.getLogger("uvicorn.error")
         self.logger.setLevel(self.log_level)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Return whether records of the given level would be emitted."""
+        return self.logger.isEnabledFor(level)
+
     def _log_with_extra(
-        self, level: int, message: str, extra_fields: Optional[dict[str, Any]] = None
+        self,
+        level: int,
+        message: str,
+        args: tuple[Any, ...] = (),
+        extra_fields: Optional[dict[str, Any]] = None,
     ) -> None:
-        """Log with extra structured fields."""
+        """Log with extra structured fields.
+
+        ``message`` uses %-style placeholders filled from ``args``; formatting
+        is left to the stdlib logger, so filtered records are never formatted.
+        """
+        # Skip serializing extra fields for records that would be filtered out
+        if not self.logger.isEnabledFor(level):
+            return
+
         if extra_fields:
-            # Format extra fields as JSON and append to message
-            extra_json = json.dumps(extra_fields, ensure_ascii=False)
-            formatted_message = f"{message} | {extra_json}"
-            self.logger.log(level, formatted_message)
-        else:
-            self.logger.log(level, message)
-
-    def info(self, message: str, extra_fields: Optional[dict[str, Any]] = None) -> None:
+            # Append extra fields as JSON, passed as one more format argument
+            message = f"{message} | %s"
+            args = (*args, _dump_extra_fields(extra_fields))
+        self.logger.log(level, message, *args)
+
+    def info(
+        self,
+        message: str,
+        *args: Any,
+        extra_fields: Optional[dict[str, Any]] = None,
+    ) -> None:
         """Log info message."""
-        self._log_with_extra(logging.INFO, message, extra_fields)
+        self._log_with_extra(logging.INFO, message, args, extra_fields)
 
     def warning(
-        self, message: str, extra_fields: Optional[dict[str, Any]] = None
+        self,
+        message: str,
+        *args: Any,
+        extra_fields: Optional[dict[str, Any]] = None,
     ) -> None:
         """Log warning message."""
-        self._log_with_extra(logging.WARNING, message, extra_fields)
+        self._log_with_extra(logging.WARNING, message, args, extra_fields)
 
     def error(
-        self, message: str, extra_fields: Optional[dict[str, Any]] = None
+        self,
+        message: str,
+        *args: Any,
+        extra_fields: Optional[dict[str, Any]] = None,
     ) -> None:
         """Log error message."""
-        self._log_with_extra(logging.ERROR, message, extra_fields)
+        self._log_with_extra(logging.ERROR, message, args, extra_fields)
 
     def critical(
-        self, message: str, extra_fields: Optional[dict[str, Any]] = None
+        self,
+        message: str,
+        *args: Any,
+        extra_fields: Optional[dict[str, Any]] = None,
     ) -> None:
         """Log critical message."""
-        self._log_with_extra(logging.CRITICAL, message, extra_fields)
+        self._log_with_extra(logging.CRITICAL, message, args, extra_fields)
 
     def debug(
-        self, message: str, extra_fields: Optional[dict[str, Any]] = None
+        self,
+        message: str,
+        *args: Any,
+        extra_fields: Optional[dict[str, Any]] = None,
     ) -> None:
         """Log debug message."""
-        self._log_with_extra(logging.DEBUG, message, extra_fields)
+        self._log_with_extra(logging.DEBUG, message, args, extra_fields)
 
     def exception(
-        self, message: str, extra_fields: Optional[dict[str, Any]] = None
+        self,
+        message: str,
+        *args: Any,
+        extra_fields: Optional[dict[str, Any]] = None,
     ) -> None:
         """Log exception with traceback."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+
         if extra_fields:
-            # Format extra fields as JSON and append to message
-            extra_json = json.dumps(extra_fields, ensure_ascii=False)
-            formatted_message = f"{message} | {extra_json}"
-            self.logger.exception(formatted_message)
-        else:
-            self.logger.exception(message)
+            message = f"{message} | %s"
+            args = (*args, _dump_extra_fields(extra_fields))
+        self.logger.exception(message, *args)
 
 
 # Global logger instance using uvicorn logger
 logger = StreamPortalLogger()
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> StreamPortalLogger:
-    """Get logger instance."""
+    """Get logger instance, reusing the same instance for a given name."""
     if name:
         return StreamPortalLogger(name)
     return logger
@@ -88,3 +135,72 @@ def get_logger(name: Optional[str] = None) -> StreamPortalLogger:
 
 # Also provide direct access to uvicorn logger for compatibility
 uvicorn_logger = logging.getLogger("uvicorn.error")
+
+# Background listener writing queued records to uvicorn's handlers
+_queue_listener: Optional[QueueListener] = None
+
+# Logger whose handlers were moved behind the queue
+_queued_logger: Optional[logging.Logger] = None
+
+
+def _handler_owner(log: logging.Logger) -> Optional[logging.Logger]:
+    """Return the logger whose handlers emit records logged on ``log``.
+
+    uvicorn's default config attaches its handlers to the parent ``uvicorn``
+    logger, so ``uvicorn.error`` usually has none of its own.
+    """
+    current: Optional[logging.Logger] = log
+    while current is not None:
+        if current.handlers:
+            return current
+        if not current.propagate:
+            return None
+        current = current.parent
+    return None
+
+
+def start_log_listener() -> None:
+    """Move uvicorn logger output to a background thread.
+
+    The handlers configured by uvicorn are put behind a queue, so logging
+    from request handlers only enqueues the record and the actual stream
+    writes happen outside the event loop.
+    """
+    global _queue_listener, _queued_logger
+
+    if _queue_listener is not None:
+        return
+
+    owner = _handler_owner(uvicorn_logger)
+    if owner is None:
+        return
+
+    handlers = list(owner.handlers)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    for handler in handlers:
+        owner.removeHandler(handler)
+    owner.addHandler(QueueHandler(log_queue))
+
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    _queued_logger = owner
+
+
+def stop_log_listener() -> None:
+    """Flush queued records and restore uvicorn's handlers."""
+    global _queue_listener, _queued_logger
+
+    if _queue_listener is None or _queued_logger is None:
+        return
+
+    # Stopping the listener drains every record still in the queue
+    _queue_listener.stop()
+
+    for handler in list(_queued_logger.handlers):
+        if isinstance(handler, QueueHandler):
+            _queued_logger.removeHandler(handler)
+    for handler in _queue_listener.handlers:
+        _queued_logger.addHandler(handler)
+
+    _queue_listener = None
+    _queued_logger = None
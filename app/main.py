@@ -1,35 +1,46 @@
 """Application and API endpoints."""
 
 import os
-import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from types import MappingProxyType
+from typing import Annotated, Literal
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, validator
+from fastapi.responses import (
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
+from pydantic import BaseModel, Field, StringConstraints, field_validator
 
 from app.errors import (
+    MAX_SEARCH_QUERY_LENGTH,
+    MIN_SEARCH_QUERY_LENGTH,
     AuthenticationError,
     ExternalAPIError,
     StreamPortalError,
+    ValidationError,
+    generic_error_body,
     handle_generic_exception,
-    handle_streamportal_error,
+    streamportal_error_body,
+    streamportal_error_response,
     validate_api_key,
-    validate_content_id,
-    validate_content_type,
-    validate_search_query,
 )
-from app.logger import get_logger
-from app.movies import get_movie_details, search_movies
+from app.logger import get_logger, start_log_listener, stop_log_listener
 from app.security import (
+    RequestObservabilityMiddleware,
     get_client_ip,
     log_error,
-    log_request,
-    rate_limit_middleware,
+    rate_limiter,
     sanitize_input,
 )
-from app.series import get_series_details, search_series
 
 # Load environment variables
 load_dotenv()
@@ -41,47 +52,50 @@ logger = get_logger("main")
 TMDB_API_KEY = os.getenv("TMDB_API_KEY")
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
 
+# TMDB request headers, built once the API key has been validated
+TMDB_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+
+# Content types accepted by the search and details endpoints
+ContentType = Literal["Movie", "Series"]
+
+# Content lookups called by the endpoints with the request's fields and headers
+SearchFunction = Callable[..., Awaitable[list[dict]]]
+StreamFunction = Callable[..., AsyncIterator[dict]]
+DetailsFunction = Callable[..., Awaitable[dict]]
+
+# Search text, length-checked by pydantic-core once it has been sanitized
+SearchText = Annotated[
+    str,
+    StringConstraints(
+        min_length=MIN_SEARCH_QUERY_LENGTH, max_length=MAX_SEARCH_QUERY_LENGTH
+    ),
+]
+
 
 class SearchRequest(BaseModel):
     """Request model for search endpoint."""
 
-    text_search: str
-    type_of_content: str
+    text_search: SearchText
+    type_of_content: ContentType
     option_language: str = "en-US"
 
-    @validator("text_search")
+    @field_validator("text_search", mode="before")
+    @classmethod
     def sanitize_text_search(cls, v):
-        """Sanitize and validate search text."""
-        sanitized = sanitize_input(v)
-        validate_search_query(sanitized)
-        return sanitized
-
-    @validator("type_of_content")
-    def validate_content_type(cls, v):
-        """Validate content type."""
-        validate_content_type(v)
+        """Sanitize search text before its length is validated."""
+        if isinstance(v, str):
+            return sanitize_input(v)
         return v
 
 
 class DetailsRequest(BaseModel):
     """Request model for details endpoint."""
 
-    content_id: int
-    type_of_content: str
+    content_id: int = Field(gt=0)
+    type_of_content: ContentType
     option_language: str = "en-US"
 
-    @validator("content_id")
-    def validate_content_id(cls, v):
-        """Validate content ID."""
-        validate_content_id(v)
-        return v
-
-    @validator("type_of_content")
-    def validate_content_type(cls, v):
-        """Validate content type."""
-        validate_content_type(v)
-        return v
-
 
 class SearchResponse(BaseModel):
     """Response model for search endpoint."""
@@ -95,113 +109,187 @@ class DetailsResponse(BaseModel):
     details: dict
 
 
-app = FastAPI(
-    title="StreamPortal API",
-    description=(
-        "A secure API for searching movies and series with streaming availability"
-    ),
-    version="1.0.0",
-)
+def _build_tmdb_headers(api_key: str) -> Mapping[str, str]:
+    """Build TMDB request headers, raising AuthenticationError on a bad key."""
+    validate_api_key(api_key)
+    return MappingProxyType(
+        {"accept": "application/json", "Authorization": f"Bearer {api_key}"}
+    )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=ALLOWED_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["GET", "POST"],
-    allow_headers=["*"],
-)
 
+def get_headers() -> Mapping[str, str]:
+    """Get TMDB request headers.
 
-def get_headers():
-    """Get headers with API key from environment variable."""
-    if not TMDB_API_KEY:
-        raise AuthenticationError("TMDB_API_KEY environment variable is required")
-    return {
-        "accept": "application/json",
-        "Authorization": f"Bearer {TMDB_API_KEY}",
-    }
+    They are built at startup; paths that skip startup build them on first
+    use, so requests never go out with empty headers.
+    """
+    global TMDB_HEADERS
 
+    if not TMDB_HEADERS:
+        TMDB_HEADERS = _build_tmdb_headers(TMDB_API_KEY)
+    return TMDB_HEADERS
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """Add processing time header and log requests."""
-    start_time = time.time()
 
-    try:
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
+# Content lookups are injected as dependencies mapping each content type to
+# its function; endpoints pick from them with ``type_of_content``. Content
+# modules (and aiohttp) are imported on first use rather than at application
+# startup, and the providers are coroutines so FastAPI does not hop to its
+# threadpool for them. They take no request body, so it is validated once.
+async def get_search_functions() -> Mapping[ContentType, SearchFunction]:
+    """Provide the search function for each content type."""
+    from app.movies import search_movies
+    from app.series import search_series
 
-        # Log successful requests
-        log_request(request, process_time)
+    return {"Movie": search_movies, "Series": search_series}
 
-        return response
-    except Exception as e:
-        process_time = time.time() - start_time
-        log_error(request, e)
-        raise
 
+async def get_stream_functions() -> Mapping[ContentType, StreamFunction]:
+    """Provide the streamed search function for each content type."""
+    from app.movies import stream_movies
+    from app.series import stream_series
 
-@app.middleware("http")
-async def rate_limit(request: Request, call_next):
-    """Apply rate limiting to all requests."""
-    return await rate_limit_middleware(request, call_next)
+    return {"Movie": stream_movies, "Series": stream_series}
+
+
+async def get_details_functions() -> Mapping[ContentType, DetailsFunction]:
+    """Provide the details function for each content type."""
+    from app.movies import get_movie_details
+    from app.series import get_series_details
+
+    return {"Movie": get_movie_details, "Series": get_series_details}
 
 
-@app.exception_handler(StreamPortalError)
 async def streamportal_error_handler(request: Request, exc: StreamPortalError):
     """Handle StreamPortal custom errors."""
-    return JSONResponse(
-        status_code=exc.status_code, content=handle_streamportal_error(exc)
-    )
+    return streamportal_error_response(exc)
+
+
+# Pydantic error types reporting an invalid value rather than a malformed body
+_INVALID_VALUE_ERROR_TYPES = frozenset(
+    {"literal_error", "greater_than", "string_too_short", "string_too_long"}
+)
+
+
+async def request_validation_error_handler(
+    request: Request, exc: RequestValidationError
+):
+    """Report invalid field values as StreamPortal validation errors.
+
+    Constraint failures are answered with ``400 VALIDATION_ERROR`` like the
+    rest of the API; missing fields and malformed bodies keep FastAPI's
+    default ``422`` response.
+    """
+    errors = exc.errors()
+    if errors and all(error["type"] in _INVALID_VALUE_ERROR_TYPES for error in errors):
+        error = errors[0]
+        return streamportal_error_response(
+            ValidationError(error["msg"], field=str(error["loc"][-1]))
+        )
+    return await request_validation_exception_handler(request, exc)
 
 
-@app.exception_handler(Exception)
 async def generic_error_handler(request: Request, exc: Exception):
-    """Handle generic exceptions."""
+    """Handle generic exceptions.
+
+    StreamPortal errors never reach this handler: Starlette resolves the most
+    specific registered handler through the exception's MRO.
+    """
     client_ip = get_client_ip(request)
+    exception_type = type(exc).__name__
     logger.exception(
-        f"Unhandled exception for IP {client_ip}",
+        "Unhandled exception for IP %s",
+        client_ip,
         extra_fields={
             "client_ip": client_ip,
             "path": request.url.path,
             "method": request.method,
-            "exception_type": type(exc).__name__,
+            "exception_type": exception_type,
         },
     )
 
-    error_response = handle_generic_exception(exc, "API Request")
+    error_response = handle_generic_exception(exc, "API Request", exception_type)
     return JSONResponse(status_code=500, content=error_response)
 
 
+app = FastAPI(
+    title="StreamPortal API",
+    description=(
+        "A secure API for searching movies and series with streaming availability"
+    ),
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    # Outermost first: rate limiting, timing and request logging wrap CORS
+    middleware=[
+        Middleware(RequestObservabilityMiddleware, limiter=rate_limiter),
+        Middleware(
+            CORSMiddleware,
+            allow_origins=ALLOWED_ORIGINS,
+            allow_credentials=True,
+            allow_methods=["GET", "POST"],
+            allow_headers=["*"],
+        ),
+    ],
+    exception_handlers={
+        StreamPortalError: streamportal_error_handler,
+        RequestValidationError: request_validation_error_handler,
+        Exception: generic_error_handler,
+    },
+)
+
+
 @app.on_event("startup")
 async def startup_event():
     """Validate configuration on startup."""
+    global TMDB_HEADERS
+
     if not TMDB_API_KEY:
         logger.critical("TMDB_API_KEY environment variable is required")
         raise ValueError("TMDB_API_KEY environment variable is required")
 
-    # Validate API key
+    # Validate API key; it is fixed for the lifetime of the process
     try:
-        validate_api_key(TMDB_API_KEY)
+        TMDB_HEADERS = _build_tmdb_headers(TMDB_API_KEY)
         logger.info("TMDB API key validated successfully")
     except AuthenticationError as e:
-        logger.critical(f"Invalid TMDB API key: {e.message}")
+        logger.critical("Invalid TMDB API key: %s", e.message)
         raise
 
-    logger.info(f"CORS configured for origins: {ALLOWED_ORIGINS}")
+    logger.info("CORS configured for origins: %s", ALLOWED_ORIGINS)
+
+    # Configuration is valid: hand log writes over to the background listener
+    start_log_listener()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close outgoing connections and flush pending log records on shutdown."""
+    from app.http_client import close_session
+
+    await close_session()
+    stop_log_listener()
+
+
+# Health probes always get the same body, so it is serialized once
+_HEALTH_BODY = orjson.dumps(
+    {"status": "healthy", "message": "StreamPortal API is running"}
+)
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    logger.info("Health check requested")
-    return {"status": "healthy", "message": "StreamPortal API is running"}
+    logger.debug("Health check requested")
+    # A fresh Response per probe: middlewares append headers to its header list
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.post("/search")
-async def search(request: SearchRequest):
+async def search(
+    request: SearchRequest,
+    search_functions: Annotated[
+        Mapping[ContentType, SearchFunction], Depends(get_search_functions)
+    ],
+):
     """Search endpoint for movies and series - returns basic info only.
 
     This endpoint performs a quick search and returns basic information
@@ -209,7 +297,9 @@ async def search(request: SearchRequest):
     Perfect for displaying search results in a webapp.
     """
     logger.info(
-        f"Search request: {request.type_of_content} - '{request.text_search}'",
+        "Search request: %s - '%s'",
+        request.type_of_content,
+        request.text_search,
         extra_fields={
             "content_type": request.type_of_content,
             "search_query": request.text_search,
@@ -220,49 +310,102 @@ async def search(request: SearchRequest):
     headers = get_headers()
 
     try:
-        if request.type_of_content == "Movie":
-            response = await search_movies(
-                request.text_search, request.option_language, headers
-            )
-            logger.info(
-                f"Movie search completed: {len(response)} results found",
-                extra_fields={"result_count": len(response)},
-            )
-            return SearchResponse(results=response)
-        else:  # Series
-            response = await search_series(
-                request.text_search, request.option_language, headers
-            )
-            logger.info(
-                f"Series search completed: {len(response)} results found",
-                extra_fields={"result_count": len(response)},
-            )
-            return SearchResponse(results=response)
+        search_content = search_functions[request.type_of_content]
+        response = await search_content(
+            request.text_search, request.option_language, headers
+        )
+        logger.info(
+            "%s search completed: %s results found",
+            request.type_of_content,
+            len(response),
+            extra_fields={"result_count": len(response)},
+        )
+        return SearchResponse(results=response)
+    except StreamPortalError:
+        raise
     except Exception as e:
         logger.error(
-            f"Search failed: {e!s}",
+            "Search failed: %s",
+            e,
             extra_fields={
                 "content_type": request.type_of_content,
                 "search_query": request.text_search,
                 "error_type": type(e).__name__,
             },
         )
-        if isinstance(e, StreamPortalError):
-            raise
-        else:
-            raise ExternalAPIError(f"Search failed: {e!s}", "TMDB API")
+        raise ExternalAPIError(f"Search failed: {e!s}", "TMDB API") from e
+
+
+@app.post("/search/stream")
+async def search_stream(
+    request: SearchRequest,
+    http_request: Request,
+    stream_functions: Annotated[
+        Mapping[ContentType, StreamFunction], Depends(get_stream_functions)
+    ],
+):
+    """Streaming variant of the search endpoint.
+
+    Returns the same basic info as ``/search`` as newline-delimited JSON,
+    one result per line, flushed as each TMDB page arrives instead of after
+    the slowest one. The status is sent with the first line, so a failure
+    part-way through ends the stream with an ``{"error": ...}`` line instead.
+    """
+    logger.info(
+        "Streamed search request: %s - '%s'",
+        request.type_of_content,
+        request.text_search,
+        extra_fields={
+            "content_type": request.type_of_content,
+            "search_query": request.text_search,
+            "language": request.option_language,
+        },
+    )
+
+    headers = get_headers()
+
+    stream_results = stream_functions[request.type_of_content]
+
+    async def generate():
+        # A failure is logged once, with the request's context, and its error
+        # body is built without logging it again
+        try:
+            async for result in stream_results(
+                request.text_search, request.option_language, headers
+            ):
+                yield orjson.dumps(result) + b"\n"
+        except StreamPortalError as e:
+            log_error(http_request, e)
+            yield orjson.dumps(streamportal_error_body(e)) + b"\n"
+        except Exception as e:
+            log_error(http_request, e)
+            body = generic_error_body("Streamed search", type(e).__name__)
+            yield orjson.dumps(body) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @app.post("/details")
-async def get_details(request: DetailsRequest):
+async def get_details(
+    request: DetailsRequest,
+    details_functions: Annotated[
+        Mapping[ContentType, DetailsFunction], Depends(get_details_functions)
+    ],
+):
     """Get detailed information for a specific movie or series.
 
     This endpoint is called when a user clicks on a search result.
     It performs the heavy lifting of checking streaming availability
     and gathering detailed metadata.
+
+    Series details return a ``stream_url_template`` to fill in with a season
+    and episode from ``valid_episodes``; the former ``streaming_urls`` list
+    is no longer included.
     """
     logger.info(
-        f"Details request: {request.type_of_content} ID {request.content_id}",
+        "Details request: %s ID %s",
+        request.type_of_content,
+        request.content_id,
         extra_fields={
             "content_type": request.type_of_content,
             "content_id": request.content_id,
@@ -273,41 +416,32 @@ async def get_details(request: DetailsRequest):
     headers = get_headers()
 
     try:
-        if request.type_of_content == "Movie":
-            response = await get_movie_details(
-                request.content_id, request.option_language, headers
-            )
-            logger.info(
-                "Movie details retrieved successfully",
-                extra_fields={
-                    "content_id": request.content_id,
-                    "is_available": response.get("is_available", False),
-                },
-            )
-            return DetailsResponse(details=response)
-        else:  # Series
-            response = await get_series_details(
-                request.content_id, request.option_language, headers
-            )
-            logger.info(
-                "Series details retrieved successfully",
-                extra_fields={
-                    "content_id": request.content_id,
-                    "is_available": response.get("is_available", False),
-                    "seasons_count": len(response.get("valid_seasons", [])),
-                },
-            )
-            return DetailsResponse(details=response)
+        get_content_details = details_functions[request.type_of_content]
+        response = await get_content_details(
+            request.content_id, request.option_language, headers
+        )
+        extra_fields = {
+            "content_id": request.content_id,
+            "is_available": response.get("is_available", False),
+        }
+        if request.type_of_content == "Series":
+            extra_fields["seasons_count"] = len(response.get("valid_seasons", []))
+        logger.info(
+            "%s details retrieved successfully",
+            request.type_of_content,
+            extra_fields=extra_fields,
+        )
+        return DetailsResponse(details=response)
+    except StreamPortalError:
+        raise
     except Exception as e:
         logger.error(
-            f"Details retrieval failed: {e!s}",
+            "Details retrieval failed: %s",
+            e,
             extra_fields={
                 "content_type": request.type_of_content,
                 "content_id": request.content_id,
                 "error_type": type(e).__name__,
             },
         )
-        if isinstance(e, StreamPortalError):
-            raise
-        else:
-            raise ExternalAPIError(f"Failed to get details: {e!s}", "TMDB API")
+        raise ExternalAPIError(f"Failed to get details: {e!s}", "TMDB API") from e
@@ -3,76 +3,56 @@
 import asyncio
 
 import aiohttp
+import orjson
 
+from app.cache import DETAILS_TTL, SEARCH_TTL, tmdb_cache
 from app.errors import ExternalAPIError, NotFoundError
+from app.http_client import get_session, get_with_retry
 from app.logger import get_logger
-from app.utils import check_url_exists_async
+from app.utils import build_search_params, check_url_exists_async
 
 # Get logger instance
 logger = get_logger("movies")
 
+# TMDB search endpoint; query parameters are passed separately
+TMDB_SEARCH_MOVIE_URL = "https://api.themoviedb.org/3/search/movie"
+
 
 async def search_movies(text_search, option_language, headers):
     """Quick search that returns basic movie information."""
     movies_list = []
 
     logger.info(
-        f"Starting movie search for: '{text_search}'",
+        "Starting movie search for: '%s'",
+        text_search,
         extra_fields={"search_query": text_search, "language": option_language},
     )
 
-    # Create aiohttp session for concurrent requests
-    async with aiohttp.ClientSession() as session:
-        # Search through first 5 pages concurrently
-        tasks = []
-        for page in range(1, 6):
-            url = (
-                f"https://api.themoviedb.org/3/search/movie?query={text_search}"
-                f"&include_adult=false&language={option_language}&page={page}"
-            )
-            tasks.append(fetch_movie_page(session, url, headers, page))
-
-        # Execute all page requests concurrently
-        page_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process all movies from all pages - only basic info
-        for page_num, page_data in enumerate(page_results, 1):
-            if isinstance(page_data, Exception):
-                logger.error(
-                    f"Failed to fetch page {page_num}",
-                    extra_fields={
-                        "page": page_num,
-                        "error": str(page_data),
-                        "error_type": type(page_data).__name__,
-                    },
-                )
-                continue
-
-            if isinstance(page_data, dict) and page_data.get("results"):
-                logger.debug(
-                    f"Processing page {page_num} with "
-                    f"{len(page_data['results'])} movies",
-                    extra_fields={
-                        "page": page_num,
-                        "movies_count": len(page_data["results"]),
-                    },
-                )
-
-                for movie in page_data["results"]:
-                    poster = await display_movie_poster(movie)
-                    movies_list.append(
-                        {
-                            "id": movie["id"],
-                            "original_title": movie["original_title"],
-                            "overview": movie["overview"],
-                            "release_date": movie["release_date"],
-                            "vote_average": movie["vote_average"],
-                            "poster": poster,
-                        }
-                    )
+    # Shared session: TMDB connections are pooled across requests
+    session = get_session()
+
+    # Search through first 5 pages concurrently; aiohttp encodes the query
+    tasks = [
+        fetch_movie_page(
+            session,
+            build_search_params(text_search, option_language, page),
+            headers,
+            page,
+        )
+        for page in range(1, 6)
+    ]
+
+    # Execute all page requests concurrently
+    # fetch_movie_page absorbs its own failures, so gather never sees exceptions
+    page_results = await asyncio.gather(*tasks)
+
+    # Process all movies from all pages - only basic info
+    for page_num, page_data in enumerate(page_results, 1):
+        movies_list.extend(movie_page_results(page_num, page_data))
 
     logger.info(
-        f"Movie search completed: {len(movies_list)} movies found",
+        "Movie search completed: %s movies found",
+        len(movies_list),
         extra_fields={"total_movies": len(movies_list), "search_query": text_search},
     )
 
@@ -82,121 +62,214 @@ async def search_movies(text_search, option_language, headers):
         return []
 
 
+async def stream_movies(text_search, option_language, headers):
+    """Yield basic movie information page by page as TMDB responds."""
+    logger.info(
+        "Starting streamed movie search for: '%s'",
+        text_search,
+        extra_fields={"search_query": text_search, "language": option_language},
+    )
+
+    session = get_session()
+
+    async def fetch_numbered_page(page):
+        params = build_search_params(text_search, option_language, page)
+        return page, await fetch_movie_page(session, params, headers, page)
+
+    # Pages are emitted in arrival order, so a slow page does not block the rest
+    movies_count = 0
+    for next_page in asyncio.as_completed(
+        [fetch_numbered_page(page) for page in range(1, 6)]
+    ):
+        page_num, page_data = await next_page
+        for movie in movie_page_results(page_num, page_data):
+            movies_count += 1
+            yield movie
+
+    logger.info(
+        "Streamed movie search completed: %s movies found",
+        movies_count,
+        extra_fields={"total_movies": movies_count, "search_query": text_search},
+    )
+
+
+def movie_page_results(page_num, page_data):
+    """Extract basic movie information from a fetched page of results."""
+    results = page_data["results"]
+    if not results:
+        return []
+
+    logger.debug(
+        "Processing page %s with %s movies",
+        page_num,
+        len(results),
+        extra_fields={"page": page_num, "movies_count": len(results)},
+    )
+
+    return [
+        {
+            "id": movie["id"],
+            "original_title": movie["original_title"],
+            "overview": movie["overview"],
+            "release_date": movie["release_date"],
+            "vote_average": movie["vote_average"],
+            "poster": display_movie_poster(movie),
+        }
+        for movie in results
+    ]
+
+
 async def get_movie_details(movie_id, option_language, headers):
     """Get detailed movie information including streaming availability check."""
     logger.info(
-        f"Getting details for movie ID: {movie_id}",
+        "Getting details for movie ID: %s",
+        movie_id,
         extra_fields={"movie_id": movie_id, "language": option_language},
     )
 
-    async with aiohttp.ClientSession() as session:
-        # Get movie details from TMDB
-        movie_url = (
-            f"https://api.themoviedb.org/3/movie/{movie_id}?language={option_language}"
-        )
+    session = get_session()
 
-        try:
-            async with session.get(movie_url, headers=headers) as response:
-                if response.status == 404:
-                    raise NotFoundError(
-                        f"Movie with ID {movie_id} not found", "Movie", movie_id
-                    )
-                elif response.status != 200:
-                    raise ExternalAPIError(
-                        f"TMDB API returned status {response.status}",
-                        "TMDB API",
-                        response.status,
-                    )
-                movie_data = await response.json()
-        except aiohttp.ClientError as e:
-            logger.error(
-                "Network error fetching movie details",
-                extra_fields={"movie_id": movie_id, "error": str(e)},
-            )
-            raise ExternalAPIError(f"Network error: {e!s}", "TMDB API")
-        except Exception as e:
-            if isinstance(e, (NotFoundError, ExternalAPIError)):
-                raise
-            logger.error(
-                "Unexpected error fetching movie details",
-                extra_fields={"movie_id": movie_id, "error": str(e)},
-            )
-            raise ExternalAPIError(f"Failed to fetch movie details: {e!s}", "TMDB API")
-
-        # Check streaming availability
-        url_to_check = f"https://vixsrc.to/movie/{movie_id}"
-        try:
-            is_available = await check_url_exists_async(session, url_to_check)
-            logger.debug(
-                f"Streaming availability check for movie {movie_id}",
-                extra_fields={"movie_id": movie_id, "is_available": is_available},
-            )
-        except Exception as e:
-            logger.warning(
-                f"Failed to check streaming availability for movie {movie_id}",
-                extra_fields={"movie_id": movie_id, "error": str(e)},
-            )
-            is_available = False
+    # TMDB details and the vixsrc probe are independent, so run them together
+    url_to_check = f"https://vixsrc.to/movie/{movie_id}"
+    movie_data, is_available = await asyncio.gather(
+        tmdb_cache.get_or_set(
+            f"tmdb:movie:{movie_id}:{option_language}",
+            lambda: fetch_movie_details(session, movie_id, option_language, headers),
+            ttl=DETAILS_TTL,
+        ),
+        check_movie_availability(session, movie_id, url_to_check),
+    )
 
-        poster = await display_movie_poster(movie_data)
+    poster = display_movie_poster(movie_data)
 
-        backdrop_path = None
-        if movie_data.get("backdrop_path"):
-            backdrop_path = (
-                f"https://image.tmdb.org/t/p/original{movie_data['backdrop_path']}"
-            )
+    backdrop_path = None
+    if movie_data.get("backdrop_path"):
+        backdrop_path = (
+            f"https://image.tmdb.org/t/p/original{movie_data['backdrop_path']}"
+        )
 
-        result = {
-            "id": movie_data["id"],
-            "url": url_to_check if is_available else None,
+    result = {
+        "id": movie_data["id"],
+        "url": url_to_check if is_available else None,
+        "is_available": is_available,
+        "original_title": movie_data["original_title"],
+        "overview": movie_data["overview"],
+        "release_date": movie_data["release_date"],
+        "vote_average": movie_data["vote_average"],
+        "vote_count": movie_data.get("vote_count", 0),
+        "runtime": movie_data.get("runtime", 0),
+        "genres": [genre["name"] for genre in movie_data.get("genres", [])],
+        "poster": poster,
+        "backdrop_path": backdrop_path,
+        "budget": movie_data.get("budget", 0),
+        "revenue": movie_data.get("revenue", 0),
+        "status": movie_data.get("status", "Unknown"),
+    }
+
+    logger.info(
+        "Movie details retrieved successfully",
+        extra_fields={
+            "movie_id": movie_id,
+            "title": movie_data["original_title"],
             "is_available": is_available,
-            "original_title": movie_data["original_title"],
-            "overview": movie_data["overview"],
-            "release_date": movie_data["release_date"],
-            "vote_average": movie_data["vote_average"],
-            "vote_count": movie_data.get("vote_count", 0),
-            "runtime": movie_data.get("runtime", 0),
-            "genres": [genre["name"] for genre in movie_data.get("genres", [])],
-            "poster": poster,
-            "backdrop_path": backdrop_path,
-            "budget": movie_data.get("budget", 0),
-            "revenue": movie_data.get("revenue", 0),
-            "status": movie_data.get("status", "Unknown"),
-        }
+            "genres_count": len(result["genres"]),
+        },
+    )
+
+    return result
+
 
-        logger.info(
-            "Movie details retrieved successfully",
-            extra_fields={
-                "movie_id": movie_id,
-                "title": movie_data["original_title"],
-                "is_available": is_available,
-                "genres_count": len(result["genres"]),
-            },
+async def fetch_movie_details(session, movie_id, option_language, headers):
+    """Fetch movie details from TMDB, raising on any failure."""
+    movie_url = f"https://api.themoviedb.org/3/movie/{movie_id}"
+
+    try:
+        status, body = await get_with_retry(
+            session, movie_url, params={"language": option_language}, headers=headers
         )
+        if status == 404:
+            raise NotFoundError(
+                f"Movie with ID {movie_id} not found", "Movie", movie_id
+            )
+        elif status != 200:
+            raise ExternalAPIError(
+                f"TMDB API returned status {status}", "TMDB API", status
+            )
+        return orjson.loads(body)
+    except aiohttp.ClientError as e:
+        logger.error(
+            "Network error fetching movie details",
+            extra_fields={"movie_id": movie_id, "error": str(e)},
+        )
+        raise ExternalAPIError(f"Network error: {e!s}", "TMDB API") from e
+    except (NotFoundError, ExternalAPIError):
+        raise
+    except Exception as e:
+        logger.error(
+            "Unexpected error fetching movie details",
+            extra_fields={"movie_id": movie_id, "error": str(e)},
+        )
+        raise ExternalAPIError(
+            f"Failed to fetch movie details: {e!s}", "TMDB API"
+        ) from e
 
-        return result
+
+async def check_movie_availability(session, movie_id, url_to_check):
+    """Check whether a movie can be streamed, treating failures as unavailable."""
+    try:
+        is_available = await check_url_exists_async(session, url_to_check)
+        logger.debug(
+            "Streaming availability check for movie %s",
+            movie_id,
+            extra_fields={"movie_id": movie_id, "is_available": is_available},
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to check streaming availability for movie %s",
+            movie_id,
+            extra_fields={"movie_id": movie_id, "error": str(e)},
+        )
+        is_available = False
+    return is_available
 
 
-async def fetch_movie_page(session, url, headers, page_num):
+async def fetch_movie_page(session, params, headers, page_num):
     """Fetch a single page of movie results."""
+
+    async def fetch():
+        status, body = await get_with_retry(
+            session, TMDB_SEARCH_MOVIE_URL, params=params, headers=headers
+        )
+        if status != 200:
+            raise ExternalAPIError(
+                f"TMDB API returned status {status}", "TMDB API", status
+            )
+        return orjson.loads(body)
+
     try:
-        async with session.get(url, headers=headers) as response:
-            if response.status != 200:
-                logger.warning(
-                    f"TMDB API returned status {response.status} for page {page_num}",
-                    extra_fields={"page": page_num, "status": response.status},
-                )
-                return {"results": []}
-            return await response.json()
+        return await tmdb_cache.get_or_set(
+            f"tmdb:search:movie:{params['language']}:{page_num}:{params['query']}",
+            fetch,
+            ttl=SEARCH_TTL,
+        )
+    except ExternalAPIError as e:
+        logger.warning(
+            "TMDB API returned status %s for page %s",
+            e.status_code,
+            page_num,
+            extra_fields={"page": page_num, "status": e.status_code},
+        )
+        return {"results": []}
     except Exception as e:
         logger.error(
-            f"Failed to fetch movie page {page_num}",
+            "Failed to fetch movie page %s",
+            page_num,
             extra_fields={"page": page_num, "error": str(e)},
         )
         return {"results": []}
 
 
-async def display_movie_poster(movie):
+def display_movie_poster(movie):
     """Get movie poster URL or placeholder."""
     if movie.get("poster_path"):
         return f"https://image.tmdb.org/t/p/w500{movie['poster_path']}"
@@ -4,6 +4,7 @@ import time
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .errors import log_api_error, log_api_request
 from .logger import get_logger
@@ -13,7 +14,10 @@ logger = get_logger("security")
 
 
 class RateLimiter:
-    """Simple in-memory rate limiter."""
+    """Simple in-memory token bucket rate limiter."""
+
+    # Seconds it takes an empty bucket to refill completely
+    window = 60.0
 
     def __init__(self, requests_per_minute: int = 60) -> None:
         """Initialize RateLimiter.
@@ -22,89 +26,157 @@ class RateLimiter:
             requests_per_minute: Maximum requests allowed per minute
         """
         self.requests_per_minute = requests_per_minute
-        self.requests: dict[str, list[float]] = {}
+        self._refill_rate = requests_per_minute / self.window
+        # client_ip -> (tokens left, time of last update)
+        self.buckets: dict[str, tuple[float, float]] = {}
+        self._next_sweep = time.monotonic() + self.window
         logger.info(
-            f"Rate limiter initialized with {requests_per_minute} requests per minute"
+            "Rate limiter initialized with %s requests per minute", requests_per_minute
         )
 
     def is_allowed(self, client_ip: str) -> bool:
         """Check if request is allowed based on rate limit."""
-        current_time = time.time()
-
-        # Clean old requests (older than 1 minute)
-        if client_ip in self.requests:
-            self.requests[client_ip] = [
-                req_time
-                for req_time in self.requests[client_ip]
-                if current_time - req_time < 60
-            ]
-        else:
-            self.requests[client_ip] = []
+        current_time = time.monotonic()
+
+        if current_time >= self._next_sweep:
+            self._sweep(current_time - self.window)
+            self._next_sweep = current_time + self.window
+
+        tokens, last_update = self.buckets.get(
+            client_ip, (self.requests_per_minute, current_time)
+        )
+        tokens = min(
+            self.requests_per_minute,
+            tokens + (current_time - last_update) * self._refill_rate,
+        )
 
         # Check if under limit
-        if len(self.requests[client_ip]) >= self.requests_per_minute:
+        if tokens < 1:
             logger.warning(
-                f"Rate limit exceeded for IP: {client_ip}",
+                "Rate limit exceeded for IP: %s",
+                client_ip,
                 extra_fields={
                     "client_ip": client_ip,
-                    "request_count": len(self.requests[client_ip]),
+                    "tokens_left": round(tokens, 3),
                     "limit": self.requests_per_minute,
                 },
             )
             return False
 
-        # Add current request
-        self.requests[client_ip].append(current_time)
+        # Spend a token on the current request
+        self.buckets[client_ip] = (tokens - 1, current_time)
         return True
 
+    def _sweep(self, cutoff: float) -> None:
+        """Forget clients whose buckets have refilled completely."""
+        idle = [
+            client_ip
+            for client_ip, (_, last_update) in self.buckets.items()
+            if last_update <= cutoff
+        ]
+        for client_ip in idle:
+            del self.buckets[client_ip]
+
 
 # Global rate limiter instance
 rate_limiter = RateLimiter(requests_per_minute=60)
 
 
-async def rate_limit_middleware(request: Request, call_next):
-    """Rate limiting middleware."""
-    client_ip = get_client_ip(request)
+class RequestObservabilityMiddleware:
+    """ASGI middleware applying rate limiting, timing and request logging.
 
-    if not rate_limiter.is_allowed(client_ip):
-        logger.warning(
-            f"Rate limit exceeded for IP: {client_ip}",
-            extra_fields={
-                "client_ip": client_ip,
-                "path": request.url.path,
-                "method": request.method,
-            },
-        )
-        return JSONResponse(
-            status_code=429,
-            content={
-                "error": {
-                    "code": "RATE_LIMIT_ERROR",
-                    "message": "Too many requests. Please try again later.",
-                    "status_code": 429,
-                    "details": {"retry_after": 60},
-                }
-            },
-        )
+    Rate limiting, the ``X-Process-Time`` header and request logging are
+    handled in a single pass, so each request goes through one middleware
+    layer instead of one per concern.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter) -> None:
+        """Initialize RequestObservabilityMiddleware.
+
+        Args:
+            app: Wrapped ASGI application
+            limiter: Rate limiter applied to every HTTP request
+        """
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process a single ASGI request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        client_ip = get_client_ip(request)
+
+        if not self.limiter.is_allowed(client_ip):
+            logger.warning(
+                "Rate limit exceeded for IP: %s",
+                client_ip,
+                extra_fields={
+                    "client_ip": client_ip,
+                    "path": request.url.path,
+                    "method": request.method,
+                },
+            )
+            response = JSONResponse(
+                status_code=429,
+                content={
+                    "error": {
+                        "code": "RATE_LIMIT_ERROR",
+                        "message": "Too many requests. Please try again later.",
+                        "status_code": 429,
+                        "details": {"retry_after": 60},
+                    }
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        start_time = time.time()
+        status_code = 500
 
-    response = await call_next(request)
-    return response
+        async def send_with_process_time(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = time.time() - start_time
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-process-time", str(process_time).encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_process_time)
+        except Exception as e:
+            log_error(request, e)
+            raise
+
+        log_request(request, time.time() - start_time, status_code)
 
 
 def get_client_ip(request: Request) -> str:
-    """Get client IP address, handling proxy headers."""
+    """Get client IP address, handling proxy headers.
+
+    The result is stored on ``request.state`` so the middleware, error
+    handlers and request logging resolve it only once per request.
+    """
+    client_ip = getattr(request.state, "client_ip", None)
+    if client_ip is not None:
+        return client_ip
+
+    headers = request.headers
     # Check for forwarded headers (when behind proxy)
-    forwarded_for = request.headers.get("X-Forwarded-For")
+    forwarded_for = headers.get("X-Forwarded-For")
     if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
+        client_ip = forwarded_for.partition(",")[0].strip()
+    else:
+        # Check for real IP header, then fall back to direct client IP
+        client_ip = headers.get("X-Real-IP") or request.client.host
 
-    # Check for real IP header
-    real_ip = request.headers.get("X-Real-IP")
-    if real_ip:
-        return real_ip
-
-    # Fallback to direct client IP
-    return request.client.host
+    request.state.client_ip = client_ip
+    return client_ip
 
 
 def validate_content_type(content_type: str) -> bool:
@@ -113,26 +185,31 @@ def validate_content_type(content_type: str) -> bool:
     return content_type in allowed_types
 
 
+# Dangerous characters removed from user supplied text by str.translate
+_DANGEROUS_CHARS_TABLE = str.maketrans("", "", "<>\"'&")
+
+
 def sanitize_input(text: str) -> str:
     """Perform basic input sanitization."""
     if not text:
         return ""
 
-    # Remove potentially dangerous characters
-    dangerous_chars = ["<", ">", '"', "'", "&", "script", "javascript"]
-    sanitized = text
-    for char in dangerous_chars:
-        sanitized = sanitized.replace(char, "")
+    # Remove potentially dangerous characters in a single pass, then the
+    # keywords: case-sensitive and once each, in the original order
+    sanitized = (
+        text.translate(_DANGEROUS_CHARS_TABLE)
+        .replace("script", "")
+        .replace("javascript", "")
+    )
 
     return sanitized.strip()
 
 
-def log_request(request: Request, response_time: float) -> None:
+def log_request(request: Request, response_time: float, status_code: int = 200) -> None:
     """Log request details for monitoring."""
     client_ip = get_client_ip(request)
     method = request.method
     path = request.url.path
-    status_code = getattr(request, "status_code", 200)
     user_agent = request.headers.get("User-Agent", "Unknown")
 
     log_api_request(
@@ -3,79 +3,69 @@
 import asyncio
 
 import aiohttp
-
+import orjson
+
+from app.cache import (
+    DETAILS_TTL,
+    SEARCH_TTL,
+    SERIES_AVAILABILITY_TTL,
+    availability_cache,
+    tmdb_cache,
+)
 from app.errors import ExternalAPIError, NotFoundError
+from app.http_client import get_session, get_with_retry
 from app.logger import get_logger
-from app.utils import check_season_episodes_async, check_url_exists_async
+from app.utils import build_search_params, check_url_exists_async
 
 # Get logger instance
 logger = get_logger("series")
 
+# TMDB search endpoint; query parameters are passed separately
+TMDB_SEARCH_TV_URL = "https://api.themoviedb.org/3/search/tv"
+
+# Episode probes per season when TMDB has no count, and the upper bound
+DEFAULT_EPISODES_PER_SEASON = 20
+MAX_EPISODES_PER_SEASON = 100
+
+# Upper bound on concurrent vixsrc probes for one series
+MAX_CONCURRENT_PROBES = 20
+
 
 async def search_series(text_search, option_language, headers):
     """Quick search that returns basic series information."""
     series_list = []
 
     logger.info(
-        f"Starting series search for: '{text_search}'",
+        "Starting series search for: '%s'",
+        text_search,
         extra_fields={"search_query": text_search, "language": option_language},
     )
 
-    # Create aiohttp session for concurrent requests
-    async with aiohttp.ClientSession() as session:
-        # Search through first 3 pages concurrently
-        tasks = []
-        for page in range(1, 4):
-            url_stream = (
-                f"https://api.themoviedb.org/3/search/tv?query={text_search}"
-                f"&include_adult=false&language={option_language}&page={page}"
-            )
-            tasks.append(fetch_series_page(session, url_stream, headers, page))
-
-        # Execute all page requests concurrently
-        page_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process all series from all pages - only basic info
-        for page_num, page_data in enumerate(page_results, 1):
-            if isinstance(page_data, Exception):
-                logger.error(
-                    f"Failed to fetch page {page_num}",
-                    extra_fields={
-                        "page": page_num,
-                        "error": str(page_data),
-                        "error_type": type(page_data).__name__,
-                    },
-                )
-                continue
-
-            if isinstance(page_data, dict) and page_data.get("results"):
-                logger.debug(
-                    f"Processing page {page_num} with "
-                    f"{len(page_data['results'])} series",
-                    extra_fields={
-                        "page": page_num,
-                        "series_count": len(page_data["results"]),
-                    },
-                )
-
-                for series in page_data["results"]:
-                    poster = await display_series_poster(series)
-                    name, air_date, vote_avg, overview = await display_series_info(
-                        series
-                    )
-                    series_list.append(
-                        {
-                            "id": series["id"],
-                            "name": name,
-                            "air_date": air_date,
-                            "vote_avg": vote_avg,
-                            "overview": overview,
-                            "poster": poster,
-                        }
-                    )
+    # Shared session: TMDB connections are pooled across requests
+    session = get_session()
+
+    # Search through first 3 pages concurrently; aiohttp encodes the query
+    tasks = [
+        fetch_series_page(
+            session,
+            build_search_params(text_search, option_language, page),
+            headers,
+            page,
+        )
+        for page in range(1, 4)
+    ]
+
+    # Execute all page requests concurrently
+    # fetch_series_page absorbs its own failures, so gather never sees exceptions
+    page_results = await asyncio.gather(*tasks)
+
+    # Process all series from all pages - only basic info
+    for page_num, page_data in enumerate(page_results, 1):
+        series_list.extend(series_page_results(page_num, page_data))
 
     logger.info(
-        f"Series search completed: {len(series_list)} series found",
+        "Series search completed: %s series found",
+        len(series_list),
         extra_fields={"total_series": len(series_list), "search_query": text_search},
     )
 
@@ -85,131 +75,220 @@ async def search_series(text_search, option_language, headers):
         return []
 
 
+async def stream_series(text_search, option_language, headers):
+    """Yield basic series information page by page as TMDB responds."""
+    logger.info(
+        "Starting streamed series search for: '%s'",
+        text_search,
+        extra_fields={"search_query": text_search, "language": option_language},
+    )
+
+    session = get_session()
+
+    async def fetch_numbered_page(page):
+        params = build_search_params(text_search, option_language, page)
+        return page, await fetch_series_page(session, params, headers, page)
+
+    # Pages are emitted in arrival order, so a slow page does not block the rest
+    series_count = 0
+    for next_page in asyncio.as_completed(
+        [fetch_numbered_page(page) for page in range(1, 4)]
+    ):
+        page_num, page_data = await next_page
+        for series in series_page_results(page_num, page_data):
+            series_count += 1
+            yield series
+
+    logger.info(
+        "Streamed series search completed: %s series found",
+        series_count,
+        extra_fields={"total_series": series_count, "search_query": text_search},
+    )
+
+
+def series_page_results(page_num, page_data):
+    """Extract basic series information from a fetched page of results."""
+    results = page_data["results"]
+    if not results:
+        return []
+
+    logger.debug(
+        "Processing page %s with %s series",
+        page_num,
+        len(results),
+        extra_fields={"page": page_num, "series_count": len(results)},
+    )
+
+    return [series_summary(series) for series in results]
+
+
+def series_summary(series):
+    """Build the basic information returned for one search result."""
+    name, air_date, vote_avg, overview = display_series_info(series)
+    return {
+        "id": series["id"],
+        "name": name,
+        "air_date": air_date,
+        "vote_avg": vote_avg,
+        "overview": overview,
+        "poster": display_series_poster(series),
+    }
+
+
 async def get_series_details(series_id, option_language, headers):
     """Get detailed series information including streaming availability check."""
     logger.info(
-        f"Getting details for series ID: {series_id}",
+        "Getting details for series ID: %s",
+        series_id,
         extra_fields={"series_id": series_id, "language": option_language},
     )
 
-    async with aiohttp.ClientSession() as session:
-        # Get series details from TMDB
-        series_url = (
-            f"https://api.themoviedb.org/3/tv/{series_id}?language={option_language}"
-        )
-
-        try:
-            async with session.get(series_url, headers=headers) as response:
-                if response.status == 404:
-                    raise NotFoundError(
-                        f"Series with ID {series_id} not found", "Series", series_id
-                    )
-                elif response.status != 200:
-                    raise ExternalAPIError(
-                        f"TMDB API returned status {response.status}",
-                        "TMDB API",
-                        response.status,
-                    )
-                series_data = await response.json()
-        except aiohttp.ClientError as e:
-            logger.error(
-                "Network error fetching series details",
-                extra_fields={"series_id": series_id, "error": str(e)},
-            )
-            raise ExternalAPIError(f"Network error: {e!s}", "TMDB API")
-        except Exception as e:
-            if isinstance(e, (NotFoundError, ExternalAPIError)):
-                raise
-            logger.error(
-                "Unexpected error fetching series details",
-                extra_fields={"series_id": series_id, "error": str(e)},
-            )
-            raise ExternalAPIError(f"Failed to fetch series details: {e!s}", "TMDB API")
-
-        # Check streaming availability and get episode information
-        try:
-            (
-                valid_seasons,
-                valid_episodes,
-                streaming_urls,
-            ) = await search_series_data_async(
-                session, series_data, option_language, headers
-            )
-            logger.debug(
-                f"Streaming availability check for series {series_id}",
-                extra_fields={
-                    "series_id": series_id,
-                    "valid_seasons": len(valid_seasons),
-                    "total_episodes": len(streaming_urls),
-                },
-            )
-        except Exception as e:
-            logger.warning(
-                f"Failed to check streaming availability for series {series_id}",
-                extra_fields={"series_id": series_id, "error": str(e)},
-            )
-            valid_seasons, valid_episodes, streaming_urls = [], {}, []
-
-        poster = await display_series_poster(series_data)
-        name, air_date, vote_avg, overview = await display_series_info(series_data)
+    session = get_session()
 
-        backdrop_path = None
-        if series_data.get("backdrop_path"):
-            backdrop_path = (
-                f"https://image.tmdb.org/t/p/original{series_data['backdrop_path']}"
-            )
+    # Get series details from TMDB, served from cache when fresh
+    series_data = await tmdb_cache.get_or_set(
+        f"tmdb:tv:{series_id}:{option_language}",
+        lambda: fetch_series_details(session, series_id, option_language, headers),
+        ttl=DETAILS_TTL,
+    )
 
-        result = {
-            "id": series_data["id"],
-            "name": name,
-            "air_date": air_date,
-            "vote_avg": vote_avg,
-            "overview": overview,
-            "poster": poster,
-            "is_available": len(valid_seasons) > 0,
-            "valid_seasons": valid_seasons,
-            "valid_episodes": valid_episodes,
-            "streaming_urls": streaming_urls,
-            "number_of_seasons": series_data.get("number_of_seasons", 0),
-            "number_of_episodes": series_data.get("number_of_episodes", 0),
-            "status": series_data.get("status", "Unknown"),
-            "genres": [genre["name"] for genre in series_data.get("genres", [])],
-            "backdrop_path": backdrop_path,
-            "first_air_date": series_data.get("first_air_date", "Unknown"),
-            "last_air_date": series_data.get("last_air_date", "Unknown"),
-            "vote_count": series_data.get("vote_count", 0),
-            "popularity": series_data.get("popularity", 0),
-        }
-
-        logger.info(
-            "Series details retrieved successfully",
+    # Check streaming availability and get episode information
+    try:
+        valid_seasons, valid_episodes = await search_series_data_async(
+            session, series_data, option_language, headers
+        )
+        logger.debug(
+            "Streaming availability check for series %s",
+            series_id,
             extra_fields={
                 "series_id": series_id,
-                "name": name,
-                "is_available": result["is_available"],
-                "seasons_count": len(valid_seasons),
-                "episodes_count": len(streaming_urls),
-                "genres_count": len(result["genres"]),
+                "valid_seasons": len(valid_seasons),
+                "total_episodes": count_episodes(valid_episodes),
             },
         )
+    except Exception as e:
+        logger.warning(
+            "Failed to check streaming availability for series %s",
+            series_id,
+            extra_fields={"series_id": series_id, "error": str(e)},
+        )
+        valid_seasons, valid_episodes = [], {}
+
+    poster = display_series_poster(series_data)
+    name, air_date, vote_avg, overview = display_series_info(series_data)
+
+    backdrop_path = None
+    if series_data.get("backdrop_path"):
+        backdrop_path = (
+            f"https://image.tmdb.org/t/p/original{series_data['backdrop_path']}"
+        )
+
+    result = {
+        "id": series_data["id"],
+        "name": name,
+        "air_date": air_date,
+        "vote_avg": vote_avg,
+        "overview": overview,
+        "poster": poster,
+        "is_available": len(valid_seasons) > 0,
+        "valid_seasons": valid_seasons,
+        "valid_episodes": valid_episodes,
+        # Clients fill in season and episode from valid_episodes
+        "stream_url_template": (
+            f"https://vixsrc.to/tv/{series_data['id']}/{{season}}/{{episode}}"
+        ),
+        "number_of_seasons": series_data.get("number_of_seasons", 0),
+        "number_of_episodes": series_data.get("number_of_episodes", 0),
+        "status": series_data.get("status", "Unknown"),
+        "genres": [genre["name"] for genre in series_data.get("genres", [])],
+        "backdrop_path": backdrop_path,
+        "first_air_date": series_data.get("first_air_date", "Unknown"),
+        "last_air_date": series_data.get("last_air_date", "Unknown"),
+        "vote_count": series_data.get("vote_count", 0),
+        "popularity": series_data.get("popularity", 0),
+    }
+
+    logger.info(
+        "Series details retrieved successfully",
+        extra_fields={
+            "series_id": series_id,
+            "name": name,
+            "is_available": result["is_available"],
+            "seasons_count": len(valid_seasons),
+            "episodes_count": count_episodes(valid_episodes),
+            "genres_count": len(result["genres"]),
+        },
+    )
+
+    return result
+
 
-        return result
+async def fetch_series_details(session, series_id, option_language, headers):
+    """Fetch series details from TMDB, raising on any failure."""
+    series_url = f"https://api.themoviedb.org/3/tv/{series_id}"
+
+    try:
+        status, body = await get_with_retry(
+            session, series_url, params={"language": option_language}, headers=headers
+        )
+        if status == 404:
+            raise NotFoundError(
+                f"Series with ID {series_id} not found", "Series", series_id
+            )
+        elif status != 200:
+            raise ExternalAPIError(
+                f"TMDB API returned status {status}", "TMDB API", status
+            )
+        return orjson.loads(body)
+    except aiohttp.ClientError as e:
+        logger.error(
+            "Network error fetching series details",
+            extra_fields={"series_id": series_id, "error": str(e)},
+        )
+        raise ExternalAPIError(f"Network error: {e!s}", "TMDB API") from e
+    except (NotFoundError, ExternalAPIError):
+        raise
+    except Exception as e:
+        logger.error(
+            "Unexpected error fetching series details",
+            extra_fields={"series_id": series_id, "error": str(e)},
+        )
+        raise ExternalAPIError(
+            f"Failed to fetch series details: {e!s}", "TMDB API"
+        ) from e
 
 
-async def fetch_series_page(session, url, headers, page_num):
+async def fetch_series_page(session, params, headers, page_num):
     """Fetch a single page of series results."""
+
+    async def fetch():
+        status, body = await get_with_retry(
+            session, TMDB_SEARCH_TV_URL, params=params, headers=headers
+        )
+        if status != 200:
+            raise ExternalAPIError(
+                f"TMDB API returned status {status}", "TMDB API", status
+            )
+        return orjson.loads(body)
+
     try:
-        async with session.get(url, headers=headers) as response:
-            if response.status != 200:
-                logger.warning(
-                    f"TMDB API returned status {response.status} for page {page_num}",
-                    extra_fields={"page": page_num, "status": response.status},
-                )
-                return {"results": []}
-            return await response.json()
+        return await tmdb_cache.get_or_set(
+            f"tmdb:search:tv:{params['language']}:{page_num}:{params['query']}",
+            fetch,
+            ttl=SEARCH_TTL,
+        )
+    except ExternalAPIError as e:
+        logger.warning(
+            "TMDB API returned status %s for page %s",
+            e.status_code,
+            page_num,
+            extra_fields={"page": page_num, "status": e.status_code},
+        )
+        return {"results": []}
     except Exception as e:
         logger.error(
-            f"Failed to fetch series page {page_num}",
+            "Failed to fetch series page %s",
+            page_num,
             extra_fields={"page": page_num, "error": str(e)},
         )
         return {"results": []}
@@ -217,85 +296,117 @@ async def fetch_series_page(session, url, headers, page_num):
 
 async def search_series_data_async(session, series, option_language, headers):
     """Search for series streaming availability and episode data."""
-    url_to_check = f"https://vixsrc.to/tv/{series['id']}/1/1"
-
-    try:
-        is_available = await check_url_exists_async(session, url_to_check)
-        if not is_available:
-            logger.debug(
-                f"Series {series['id']} not available for streaming",
-                extra_fields={"series_id": series["id"]},
-            )
-            return [], {}, []
-    except Exception as e:
-        logger.warning(
-            f"Failed to check initial streaming availability for series {series['id']}",
-            extra_fields={"series_id": series["id"], "error": str(e)},
-        )
-        return [], {}, []
+    cache_key = f"vix:series:{series['id']}"
+    cached = availability_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     series_id = series["id"]
     total_seasons = min(series.get("number_of_seasons", 0), 10)
 
     logger.debug(
-        f"Checking {total_seasons} seasons for series {series_id}",
+        "Checking %s seasons for series %s",
+        total_seasons,
+        series_id,
         extra_fields={"series_id": series_id, "total_seasons": total_seasons},
     )
 
     valid_seasons = []
     valid_episodes = {}
-    streaming_urls = []
-
-    # Check seasons concurrently
-    season_tasks = []
-    for season in range(1, total_seasons + 1):
-        season_tasks.append(check_season_episodes_async(session, series_id, season))
-
-    season_results = await asyncio.gather(*season_tasks, return_exceptions=True)
-
-    for season, episodes in enumerate(season_results, 1):
-        if isinstance(episodes, Exception):
-            logger.warning(
-                f"Failed to check season {season} for series {series_id}",
-                extra_fields={
-                    "series_id": series_id,
-                    "season": season,
-                    "error": str(episodes),
-                },
-            )
-            continue
-
-        if episodes and isinstance(episodes, list):
-            valid_seasons.append(season)
-            valid_episodes[season] = episodes
-            # Add streaming URLs for this season
-            for episode in episodes:
-                streaming_urls.append(
-                    f"https://vixsrc.to/tv/{series_id}/{season}/{episode}"
-                )
-
-            logger.debug(
-                f"Season {season} has {len(episodes)} episodes",
-                extra_fields={
-                    "series_id": series_id,
-                    "season": season,
-                    "episodes_count": len(episodes),
-                },
-            )
+
+    # TMDB already lists how many episodes each season has, so probe only those
+    episode_counts = {
+        season_info.get("season_number"): season_info.get("episode_count")
+        for season_info in series.get("seasons", [])
+    }
+
+    # At most this many probes are in flight for one series at a time
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+
+    # A season only counts as streamable when its first episode is, so probe
+    # episode 1 of every season before spending requests on the others
+    seasons = range(1, total_seasons + 1)
+    first_found = await _probe_episodes(
+        session, series_id, [(season, 1) for season in seasons], semaphore
+    )
+    open_seasons = [season for season in seasons if (season, 1) in first_found]
+
+    probes = []
+    for season in open_seasons:
+        max_episodes = min(
+            episode_counts.get(season) or DEFAULT_EPISODES_PER_SEASON,
+            MAX_EPISODES_PER_SEASON,
+        )
+        probes.extend((season, episode) for episode in range(2, max_episodes + 1))
+    found_probes = first_found | await _probe_episodes(
+        session, series_id, probes, semaphore
+    )
+
+    found = {}
+    for season, episode in sorted(found_probes):
+        found.setdefault(season, []).append(episode)
+
+    for season, episodes in found.items():
+        valid_seasons.append(season)
+        valid_episodes[season] = episodes
+
+        logger.debug(
+            "Season %s has %s episodes",
+            season,
+            len(episodes),
+            extra_fields={
+                "series_id": series_id,
+                "season": season,
+                "episodes_count": len(episodes),
+            },
+        )
+
+    if not valid_seasons:
+        logger.debug(
+            "Series %s not available for streaming",
+            series_id,
+            extra_fields={"series_id": series_id},
+        )
 
     logger.info(
-        f"Series {series_id} streaming check completed",
+        "Series %s streaming check completed",
+        series_id,
         extra_fields={
             "series_id": series_id,
             "valid_seasons": len(valid_seasons),
-            "total_episodes": len(streaming_urls),
+            "total_episodes": count_episodes(valid_episodes),
         },
     )
 
-    return valid_seasons, valid_episodes, streaming_urls
+    result = valid_seasons, valid_episodes
+    # Empty results may come from failed probes, so only hits are kept
+    if valid_seasons:
+        availability_cache.set(cache_key, result, SERIES_AVAILABILITY_TTL)
+    return result
+
+
+async def _probe_episodes(session, series_id, probes, semaphore):
+    """Probe ``(season, episode)`` pairs and return the set that exists."""
+
+    async def probe(season, episode):
+        async with semaphore:
+            return await check_url_exists_async(
+                session, f"https://vixsrc.to/tv/{series_id}/{season}/{episode}"
+            )
+
+    results = await asyncio.gather(
+        *(probe(season, episode) for season, episode in probes),
+        return_exceptions=True,
+    )
+    return {pair for pair, exists in zip(probes, results) if exists is True}
+
+
+def count_episodes(valid_episodes):
+    """Count the streamable episodes across all seasons."""
+    return sum(map(len, valid_episodes.values()))
 
 
-async def display_series_poster(series):
+def display_series_poster(series):
     """Get series poster URL or placeholder."""
     if series.get("poster_path"):
         return f"https://image.tmdb.org/t/p/w500{series['poster_path']}"
@@ -303,7 +414,7 @@ async def display_series_poster(series):
         return "https://via.placeholder.com/200x300.png?text=No+Poster"
 
 
-async def display_series_info(series):
+def display_series_info(series):
     """Extract basic series information."""
     name = series["original_name"]
     air_date = series.get("first_air_date", "N/A")
@@ -1,68 +1,49 @@
-"""Utility functions for URL checking and episode validation."""
-
-import asyncio
-import concurrent.futures
+"""Utility functions for TMDB queries and URL checking."""
 
 import aiohttp
-import requests
 
+from app.cache import URL_FOUND_TTL, URL_MISSING_TTL, availability_cache
 
-def check_url_exists(url):
-    """Check if a URL exists and returns 200 status code."""
-    try:
-        response = requests.get(url, timeout=3)
-        return response.status_code == 200
-    except requests.RequestException:
-        return False
+# Probe settings for vixsrc availability checks
+_PROBE_TIMEOUT = aiohttp.ClientTimeout(total=3)
+_FIRST_BYTE_HEADERS = {"Range": "bytes=0-0"}
+
+
+def build_search_params(text_search, option_language, page):
+    """Build the TMDB query parameters for one page of search results."""
+    return {
+        "query": text_search,
+        "include_adult": "false",
+        "language": option_language,
+        "page": page,
+    }
 
 
 async def check_url_exists_async(session, url):
-    """Check if a URL exists asynchronously and returns 200 status code."""
+    """Check if a URL exists asynchronously without downloading its body."""
+    cache_key = f"vix:url:{url}"
+    cached = availability_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=3)) as response:
-            return response.status == 200
+        # Only the status matters, so skip the body unless HEAD is refused
+        async with session.head(
+            url, allow_redirects=True, timeout=_PROBE_TIMEOUT
+        ) as response:
+            status = response.status
+        if status == 405:
+            async with session.get(
+                url, headers=_FIRST_BYTE_HEADERS, timeout=_PROBE_TIMEOUT
+            ) as response:
+                status = response.status
     except Exception:
         return False
 
-
-def check_season_episodes(series_id, season, max_episodes=20):
-    """Check which episodes exist for a given season."""
-    valid_episodes = []
-    first_episode_url = f"https://vixsrc.to/tv/{series_id}/{season}/1"
-    if not check_url_exists(first_episode_url):
-        return []
-
-    episode_urls = [
-        f"https://vixsrc.to/tv/{series_id}/{season}/{ep}"
-        for ep in range(1, max_episodes + 1)
-    ]
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_episode = {
-            executor.submit(check_url_exists, url): i + 1
-            for i, url in enumerate(episode_urls)
-        }
-        for future in concurrent.futures.as_completed(future_to_episode):
-            episode_num = future_to_episode[future]
-            if future.result():
-                valid_episodes.append(episode_num)
-    return sorted(valid_episodes)
-
-
-async def check_season_episodes_async(session, series_id, season, max_episodes=20):
-    """Check which episodes exist for a given season asynchronously."""
-    valid_episodes = []
-    first_episode_url = f"https://vixsrc.to/tv/{series_id}/{season}/1"
-    if not await check_url_exists_async(session, first_episode_url):
-        return []
-
-    episode_urls = [
-        f"https://vixsrc.to/tv/{series_id}/{season}/{ep}"
-        for ep in range(1, max_episodes + 1)
-    ]
-    tasks = [check_url_exists_async(session, url) for url in episode_urls]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    for i, result in enumerate(results):
-        if result is True:
-            valid_episodes.append(i + 1)
-    return sorted(valid_episodes)
+    exists = status in (200, 206)
+    # Server errors say nothing about the URL, so they are not remembered
+    if status < 500:
+        availability_cache.set(
+            cache_key, exists, URL_FOUND_TTL if exists else URL_MISSING_TTL
+        )
+    return exists
@@ -1,47 +1,77 @@
 """Test fixtures and configuration."""
 
-import os
-from unittest.mock import patch
+from collections.abc import Callable
+from contextlib import contextmanager
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
-from app.main import app
+from app.main import (
+    app,
+    get_details_functions,
+    get_search_functions,
+    get_stream_functions,
+)
 
+# API key placed in the environment for the whole test session
+TEST_TMDB_API_KEY = "test_api_key_12345"
 
-@pytest.fixture(scope="module")
+# TMDB headers returned by the patched header lookup; read-only as tests share it
+FAKE_HEADERS = MappingProxyType(
+    {"accept": "application/json", "Authorization": "Bearer test"}
+)
+
+
+@pytest.fixture(scope="session")
 def test_client() -> TestClient:
-    """API test client.
+    """API test client, shared by the whole test session.
+
+    The client is never entered as a context manager, so the startup and
+    shutdown events do not run; a startup test needs its own client used in a
+    ``with`` block. Unhandled errors come back as 500 responses.
 
     :return: TestClient instance
     """
-    return TestClient(app)
+    return TestClient(app, raise_server_exceptions=False)
 
 
-@pytest.fixture(autouse=True, scope="session")
-def set_tmdb_api_key():
-    """Ensure TMDB_API_KEY is set for all tests."""
-    os.environ["TMDB_API_KEY"] = "test"
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run async tests on asyncio, the loop the application uses."""
+    return "asyncio"
 
 
-@pytest.fixture(autouse=True)
-def setup_test_environment():
-    """Set up test environment variables."""
-    # Set test environment variables
-    os.environ["ALLOWED_ORIGINS"] = "http://localhost:3000,http://test.com"
+@pytest.fixture(scope="session")
+async def async_client() -> AsyncClient:
+    """Async API test client, calling the ASGI app in process.
+
+    ASGITransport does not send lifespan events, so startup does not run here
+    either.
+
+    :return: AsyncClient instance
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
 
-    yield
 
-    # Clean up (optional)
-    if "ALLOWED_ORIGINS" in os.environ:
-        del os.environ["ALLOWED_ORIGINS"]
+@pytest.fixture(autouse=True, scope="session")
+def setup_test_environment():
+    """Set up test environment variables once for the whole session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TMDB_API_KEY", TEST_TMDB_API_KEY)
+        mp.setenv("ALLOWED_ORIGINS", "http://localhost:3000,http://test.com")
+        yield
 
 
 @pytest.fixture
 def mock_tmdb_api_key():
-    """Mock TMDB API key for testing."""
-    with patch.dict(os.environ, {"TMDB_API_KEY": "test_api_key_12345"}):
-        yield "test_api_key_12345"
+    """TMDB API key set for the test session."""
+    return TEST_TMDB_API_KEY
 
 
 @pytest.fixture
@@ -70,6 +100,7 @@ def sample_series_data():
     return {
         "id": 1396,
         "name": "Breaking Bad",
+        "original_name": "Breaking Bad",
         "overview": "When an unassuming chemistry teacher...",
         "first_air_date": "2008-01-20",
         "vote_average": 9.5,
@@ -127,3 +158,50 @@ def mock_series_search_results():
             "poster": "https://image.tmdb.org/t/p/w500/...",
         },
     ]
+
+
+@pytest.fixture(scope="module")
+def _patched_get_headers():
+    """Patch TMDB header lookup with test headers for a whole test module."""
+    with patch("app.main.get_headers", return_value=FAKE_HEADERS) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_get_headers():
+    """Patch TMDB header lookup for a single test that configures it."""
+    with patch("app.main.get_headers") as mock:
+        mock.return_value = FAKE_HEADERS
+        yield mock
+
+
+@contextmanager
+def _override_content_functions(provider: Callable, new_callable: type = AsyncMock):
+    """Map every content type to one mock in place of ``provider`` until exit."""
+    mock = new_callable()
+    app.dependency_overrides[provider] = lambda: {"Movie": mock, "Series": mock}
+    try:
+        yield mock
+    finally:
+        app.dependency_overrides.pop(provider, None)
+
+
+@pytest.fixture
+def mock_search():
+    """Override the search function with an AsyncMock."""
+    with _override_content_functions(get_search_functions) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_stream_search():
+    """Override the streamed search function with a MagicMock."""
+    with _override_content_functions(get_stream_functions, MagicMock) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_get_details():
+    """Override the details function with an AsyncMock."""
+    with _override_content_functions(get_details_functions) as mock:
+        yield mock
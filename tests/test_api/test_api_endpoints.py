@@ -1,28 +1,38 @@
 """Tests for StreamPortal REST API endpoints."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from types import MappingProxyType
+from unittest.mock import patch
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
-from app.errors import AuthenticationError, NotFoundError
+from app.errors import AuthenticationError, ExternalAPIError, NotFoundError
+from app.movies import movie_page_results
+from app.security import rate_limiter, sanitize_input
+from app.series import series_page_results
 
-# --- API Robustness & Edge Case Tests ---
+# Shared request fields; tests add the search text or content ID
+_BASE_MOVIE_REQUEST = MappingProxyType(
+    {"type_of_content": "Movie", "option_language": "en-US"}
+)
+_BASE_SERIES_REQUEST = MappingProxyType(
+    {"type_of_content": "Series", "option_language": "en-US"}
+)
 
+# Oversized search texts; both exceed MAX_SEARCH_QUERY_LENGTH
+_LARGE_TEXT = "a" * 10000
+_MEDIUM_TEXT = "a" * 1000
 
-def test_cors_preflight_search(test_client):
-    """Test CORS preflight (OPTIONS) on /search endpoint."""
-    response = test_client.options("/search")
-    # OPTIONS might return 405 Method Not Allowed, which is acceptable
-    assert response.status_code in [200, 405]
-    # Only check CORS headers if OPTIONS is supported
-    if response.status_code == 200:
-        assert "access-control-allow-origin" in response.headers
+# --- API Robustness & Edge Case Tests ---
 
 
-def test_cors_preflight_details(test_client):
-    """Test CORS preflight (OPTIONS) on /details endpoint."""
-    response = test_client.options("/details")
+@pytest.mark.parametrize("path", ["/search", "/details"])
+def test_cors_preflight(test_client, path):
+    """Test CORS preflight (OPTIONS) on the content endpoints."""
+    response = test_client.options(path)
     # OPTIONS might return 405 Method Not Allowed, which is acceptable
     assert response.status_code in [200, 405]
     # Only check CORS headers if OPTIONS is supported
@@ -30,50 +40,54 @@ def test_cors_preflight_details(test_client):
         assert "access-control-allow-origin" in response.headers
 
 
-def test_search_missing_fields(test_client):
-    """Test /search with missing required fields returns 422."""
-    response = test_client.post("/search", json={})
-    assert response.status_code == 422
-
-
-def test_details_missing_fields(test_client):
-    """Test /details with missing required fields returns 422."""
-    response = test_client.post("/details", json={})
+@pytest.mark.parametrize(
+    ("path", "required_fields"),
+    [
+        ("/search", {"type_of_content", "text_search"}),
+        ("/details", {"type_of_content", "content_id"}),
+    ],
+)
+def test_missing_fields(test_client, path, required_fields):
+    """Test missing required fields return 422, each reported once."""
+    response = test_client.post(path, json={})
     assert response.status_code == 422
 
-
-def test_invalid_method_on_search(test_client):
-    """Test GET method on /search returns 405 or 422."""
-    response = test_client.get("/search")
-    assert response.status_code in [405, 422]
+    fields = [error["loc"][-1] for error in response.json()["detail"]]
+    assert sorted(fields) == sorted(required_fields)
 
 
-def test_invalid_method_on_details(test_client):
-    """Test GET method on /details returns 405 or 422."""
-    response = test_client.get("/details")
+@pytest.mark.parametrize("path", ["/search", "/details"])
+def test_invalid_method(test_client, path):
+    """Test GET method on the content endpoints returns 405 or 422."""
+    response = test_client.get(path)
     assert response.status_code in [405, 422]
 
 
-@pytest.mark.skip(reason="Startup event cannot be reliably tested in this context")
-def test_startup_event_missing_api_key(monkeypatch):
-    """Test startup event fails if TMDB_API_KEY is missing."""
-    monkeypatch.delenv("TMDB_API_KEY", raising=False)
-    import asyncio
+@pytest.mark.parametrize(
+    ("path", "payload"),
+    [
+        ("/search", {"text_search": "test"}),
+        ("/details", {"content_id": 27205}),
+    ],
+)
+def test_invalid_content_type(test_client, path, payload):
+    """Test content endpoints reject an unknown content type."""
+    request_data = {
+        **payload,
+        "type_of_content": "Invalid",
+        "option_language": "en-US",
+    }
 
-    from app.main import startup_event
+    response = test_client.post(path, json=request_data)
 
-    with pytest.raises(Exception) as excinfo:
-        asyncio.run(startup_event())
-    assert "TMDB_API_KEY" in str(excinfo.value)
+    assert response.status_code == 400  # Validation error
+    data = response.json()
+    assert data["error"]["details"]["field"] == "type_of_content"
 
 
 def test_search_large_payload(test_client):
     """Test /search with very large payload returns 400."""
-    search_data = {
-        "text_search": "a" * 10000,
-        "type_of_content": "Movie",
-        "option_language": "en-US",
-    }
+    search_data = {**_BASE_MOVIE_REQUEST, "text_search": _LARGE_TEXT}
     response = test_client.post("/search", json=search_data)
     assert response.status_code == 400
 
@@ -81,12 +95,13 @@ def test_search_large_payload(test_client):
 # --- End of API Robustness & Edge Case Tests ---
 
 
+@pytest.mark.anyio
 class TestHealthEndpoint:
     """Test health check endpoint."""
 
-    def test_health_check_success(self, test_client: TestClient):
+    async def test_health_check_success(self, async_client: AsyncClient):
         """Test health check endpoint returns success."""
-        response = test_client.get("/health")
+        response = await async_client.get("/health")
 
         assert response.status_code == 200
         data = response.json()
@@ -95,304 +110,230 @@ class TestHealthEndpoint:
         assert "X-Process-Time" in response.headers
 
 
+@pytest.mark.anyio
+@pytest.mark.usefixtures("_patched_get_headers")
 class TestSearchEndpoint:
     """Test search endpoint for movies and series."""
 
-    def test_search_movies_success(self, test_client: TestClient):
-        """Test successful movie search."""
-        search_data = {
-            "text_search": "Inception",
-            "type_of_content": "Movie",
-            "option_language": "en-US",
-        }
+    @pytest.mark.parametrize(
+        ("payload", "results_fixture", "tmdb_fixture", "page_results"),
+        [
+            pytest.param(
+                {**_BASE_MOVIE_REQUEST, "text_search": "Inception"},
+                "mock_search_results",
+                "sample_movie_data",
+                movie_page_results,
+                id="movie",
+            ),
+            pytest.param(
+                {**_BASE_SERIES_REQUEST, "text_search": "Breaking Bad"},
+                "mock_series_search_results",
+                "sample_series_data",
+                series_page_results,
+                id="series",
+            ),
+        ],
+    )
+    async def test_search_success(
+        self,
+        async_client: AsyncClient,
+        request: pytest.FixtureRequest,
+        mock_search,
+        payload,
+        results_fixture,
+        tmdb_fixture,
+        page_results,
+    ):
+        """Test successful movie and series search."""
+        results = request.getfixturevalue(results_fixture)
+        mock_search.return_value = results
+        # The keys the search really returns for a TMDB result
+        tmdb_result = request.getfixturevalue(tmdb_fixture)
+        expected_keys = set(page_results(1, {"results": [tmdb_result]})[0])
+
+        response = await async_client.post("/search", json=payload)
 
-        mock_results = [
-            {
-                "id": 27205,
-                "original_title": "Inception",
-                "overview": "Cobb, a skilled thief...",
-                "release_date": "2010-07-16",
-                "vote_average": 8.4,
-                "poster": "https://image.tmdb.org/t/p/w500/...",
-            }
-        ]
-
-        with (
-            patch("app.main.get_headers") as mock_headers,
-            patch("app.main.search_movies", new_callable=AsyncMock) as mock_search,
-        ):
-            mock_headers.return_value = {
-                "accept": "application/json",
-                "Authorization": "Bearer test",
-            }
-            mock_search.return_value = mock_results
-
-            response = test_client.post("/search", json=search_data)
-
-            assert response.status_code == 200
-            data = response.json()
-            assert "results" in data
-            assert len(data["results"]) == 1
-            assert data["results"][0]["original_title"] == "Inception"
-
-            mock_search.assert_called_once()
-
-    def test_search_series_success(self, test_client: TestClient):
-        """Test successful series search."""
-        search_data = {
-            "text_search": "Breaking Bad",
-            "type_of_content": "Series",
-            "option_language": "en-US",
-        }
+        assert response.status_code == 200
+        data = response.json()
+        assert data == {"results": results}
+        assert all(set(result) == expected_keys for result in data["results"])
 
-        mock_results = [
-            {
-                "id": 1396,
-                "name": "Breaking Bad",
-                "air_date": "2008-01-20",
-                "vote_avg": 9.5,
-                "overview": "When an unassuming chemistry teacher...",
-                "poster": "https://image.tmdb.org/t/p/w500/...",
-            }
-        ]
-
-        with (
-            patch("app.main.get_headers") as mock_headers,
-            patch("app.main.search_series", new_callable=AsyncMock) as mock_search,
-        ):
-            mock_headers.return_value = {
-                "accept": "application/json",
-                "Authorization": "Bearer test",
-            }
-            mock_search.return_value = mock_results
-
-            response = test_client.post("/search", json=search_data)
-
-            assert response.status_code == 200
-            data = response.json()
-            assert "results" in data
-            assert len(data["results"]) == 1
-            assert data["results"][0]["name"] == "Breaking Bad"
-
-            mock_search.assert_called_once()
-
-    def test_search_invalid_content_type(self, test_client: TestClient):
-        """Test search with invalid content type."""
-        search_data = {
-            "text_search": "test",
-            "type_of_content": "Invalid",
-            "option_language": "en-US",
-        }
+        mock_search.assert_called_once()
 
-        response = test_client.post("/search", json=search_data)
+    async def test_search_body_validated_once(
+        self, async_client: AsyncClient, mock_search
+    ):
+        """Test the request body is parsed and sanitized once per request."""
+        search_data = {**_BASE_MOVIE_REQUEST, "text_search": "Inception"}
+        mock_search.return_value = []
 
-        assert response.status_code == 400  # Validation error
+        with patch("app.main.sanitize_input", wraps=sanitize_input) as mock_sanitize:
+            response = await async_client.post("/search", json=search_data)
 
-    def test_search_empty_query(self, test_client: TestClient):
+        assert response.status_code == 200
+        mock_sanitize.assert_called_once_with("Inception")
+
+    async def test_search_empty_query(self, async_client: AsyncClient):
         """Test search with empty query."""
-        search_data = {
-            "text_search": "",
-            "type_of_content": "Movie",
-            "option_language": "en-US",
-        }
+        search_data = {**_BASE_MOVIE_REQUEST, "text_search": ""}
 
-        response = test_client.post("/search", json=search_data)
+        response = await async_client.post("/search", json=search_data)
 
         assert response.status_code == 400  # Validation error
 
-    def test_search_malicious_input(self, test_client: TestClient):
+    async def test_search_malicious_input(self, async_client: AsyncClient, mock_search):
         """Test search with potentially malicious input."""
         search_data = {
+            **_BASE_MOVIE_REQUEST,
             "text_search": "<script>alert('xss')</script>",
-            "type_of_content": "Movie",
-            "option_language": "en-US",
         }
 
-        with (
-            patch("app.main.get_headers") as mock_headers,
-            patch("app.main.search_movies", new_callable=AsyncMock) as mock_search,
-        ):
-            mock_headers.return_value = {
-                "accept": "application/json",
-                "Authorization": "Bearer test",
-            }
-            mock_search.return_value = []
+        mock_search.return_value = []
 
-            response = test_client.post("/search", json=search_data)
+        response = await async_client.post("/search", json=search_data)
 
-            # Should sanitize and accept the input
-            assert response.status_code in [200, 400]
+        # Should sanitize and accept the input
+        assert response.status_code in [200, 400]
 
-    def test_search_external_api_error(self, test_client: TestClient):
+    async def test_search_external_api_error(
+        self, async_client: AsyncClient, mock_search
+    ):
         """Test search when external API fails."""
-        search_data = {
-            "text_search": "test",
-            "type_of_content": "Movie",
-            "option_language": "en-US",
-        }
+        search_data = {**_BASE_MOVIE_REQUEST, "text_search": "test"}
 
-        with (
-            patch("app.main.get_headers") as mock_headers,
-            patch("app.main.search_movies", new_callable=AsyncMock) as mock_search,
-        ):
-            mock_headers.return_value = {
-                "accept": "application/json",
-                "Authorization": "Bearer test",
-            }
-            mock_search.side_effect = Exception("API Error")
+        mock_search.side_effect = Exception("API Error")
 
-            response = test_client.post("/search", json=search_data)
+        response = await async_client.post("/search", json=search_data)
+
+        assert response.status_code == 502
+        data = response.json()
+        assert "error" in data
 
-            assert response.status_code == 502
-            data = response.json()
-            assert "error" in data
+    async def test_search_stream_movies(
+        self, async_client: AsyncClient, mock_stream_search
+    ):
+        """Test streamed movie search returns one JSON object per line."""
+        search_data = {**_BASE_MOVIE_REQUEST, "text_search": "Inception"}
 
+        async def mock_results():
+            yield {"id": 27205, "original_title": "Inception"}
+            yield {"id": 1124, "original_title": "The Prestige"}
 
+        mock_stream_search.return_value = mock_results()
+
+        response = await async_client.post("/search/stream", json=search_data)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.text.splitlines()
+        assert len(lines) == 2
+        assert '"original_title":"Inception"' in lines[0]
+
+        mock_stream_search.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("error", "expected_code"),
+        [
+            (
+                ExternalAPIError("TMDB API returned status 503", "TMDB API"),
+                "EXTERNAL_API_ERROR",
+            ),
+            (RuntimeError("connection reset"), "INTERNAL_ERROR"),
+        ],
+        ids=["streamportal-error", "unexpected-error"],
+    )
+    async def test_search_stream_error_mid_stream(
+        self, async_client: AsyncClient, mock_stream_search, error, expected_code
+    ):
+        """Test a failure after the first line ends the stream with an error line."""
+        search_data = {**_BASE_MOVIE_REQUEST, "text_search": "Inception"}
+
+        async def mock_results():
+            yield {"id": 27205, "original_title": "Inception"}
+            raise error
+
+        mock_stream_search.return_value = mock_results()
+
+        with patch("app.errors.logger") as mock_logger:
+            response = await async_client.post("/search/stream", json=search_data)
+
+        assert response.status_code == 200
+        lines = [orjson.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["original_title"] == "Inception"
+        assert lines[-1]["error"]["code"] == expected_code
+        assert len(lines) == 2
+        # One API error record carrying the request context, nothing else
+        mock_logger.error.assert_called_once()
+        assert mock_logger.error.call_args.kwargs["extra_fields"]["path"] == (
+            "/search/stream"
+        )
+        mock_logger.exception.assert_not_called()
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("_patched_get_headers")
 class TestDetailsEndpoint:
     """Test details endpoint for movies and series."""
 
-    def test_movie_details_success(self, test_client: TestClient):
-        """Test successful movie details retrieval."""
-        details_data = {
-            "content_id": 27205,
-            "type_of_content": "Movie",
-            "option_language": "en-US",
-        }
-
-        mock_details = {
-            "id": 27205,
-            "original_title": "Inception",
-            "overview": "Cobb, a skilled thief...",
-            "release_date": "2010-07-16",
-            "vote_average": 8.4,
-            "is_available": True,
-            "url": "https://vixsrc.to/movie/27205",
-            "genres": ["Action", "Sci-Fi"],
-            "runtime": 148,
-            "poster": "https://image.tmdb.org/t/p/w500/...",
-            "backdrop_path": "https://image.tmdb.org/t/p/original/...",
-        }
+    @pytest.mark.parametrize(
+        ("payload", "details_fixture"),
+        [
+            pytest.param(
+                {**_BASE_MOVIE_REQUEST, "content_id": 27205},
+                "sample_movie_data",
+                id="movie",
+            ),
+            pytest.param(
+                {**_BASE_SERIES_REQUEST, "content_id": 1396},
+                "sample_series_data",
+                id="series",
+            ),
+        ],
+    )
+    async def test_details_success(
+        self,
+        async_client: AsyncClient,
+        request: pytest.FixtureRequest,
+        mock_get_details,
+        payload,
+        details_fixture,
+    ):
+        """Test successful movie and series details retrieval."""
+        details = request.getfixturevalue(details_fixture)
+        mock_get_details.return_value = details
+
+        response = await async_client.post("/details", json=payload)
 
-        with (
-            patch("app.main.get_headers") as mock_headers,
-            patch(
-                "app.main.get_movie_details", new_callable=AsyncMock
-            ) as mock_details_func,
-        ):
-            mock_headers.return_value = {
-                "accept": "application/json",
-                "Authorization": "Bearer test",
-            }
-            mock_details_func.return_value = mock_details
-
-            response = test_client.post("/details", json=details_data)
-
-            assert response.status_code == 200
-            data = response.json()
-            assert "details" in data
-            assert data["details"]["original_title"] == "Inception"
-            assert data["details"]["is_available"] is True
-
-            mock_details_func.assert_called_once()
-
-    def test_series_details_success(self, test_client: TestClient):
-        """Test successful series details retrieval."""
-        details_data = {
-            "content_id": 1396,
-            "type_of_content": "Series",
-            "option_language": "en-US",
-        }
+        assert response.status_code == 200
+        assert response.json() == {"details": details}
 
-        mock_details = {
-            "id": 1396,
-            "name": "Breaking Bad",
-            "overview": "When an unassuming chemistry teacher...",
-            "first_air_date": "2008-01-20",
-            "vote_average": 9.5,
-            "is_available": True,
-            "url": "https://vixsrc.to/tv/1396",
-            "genres": ["Drama", "Crime"],
-            "valid_seasons": [1, 2, 3, 4, 5],
-            "total_episodes": 62,
-            "poster": "https://image.tmdb.org/t/p/w500/...",
-            "backdrop_path": "https://image.tmdb.org/t/p/original/...",
-        }
+        mock_get_details.assert_called_once()
 
-        with (
-            patch("app.main.get_headers") as mock_headers,
-            patch(
-                "app.main.get_series_details", new_callable=AsyncMock
-            ) as mock_details_func,
-        ):
-            mock_headers.return_value = {
-                "accept": "application/json",
-                "Authorization": "Bearer test",
-            }
-            mock_details_func.return_value = mock_details
-
-            response = test_client.post("/details", json=details_data)
-
-            assert response.status_code == 200
-            data = response.json()
-            assert "details" in data
-            assert data["details"]["name"] == "Breaking Bad"
-            assert data["details"]["is_available"] is True
-            assert len(data["details"]["valid_seasons"]) == 5
-
-            mock_details_func.assert_called_once()
-
-    def test_details_not_found(self, test_client: TestClient):
+    async def test_details_not_found(self, async_client: AsyncClient, mock_get_details):
         """Test details for non-existent content."""
-        details_data = {
-            "content_id": 999999,
-            "type_of_content": "Movie",
-            "option_language": "en-US",
-        }
+        details_data = {**_BASE_MOVIE_REQUEST, "content_id": 999999}
 
-        with (
-            patch("app.main.get_headers") as mock_headers,
-            patch(
-                "app.main.get_movie_details", new_callable=AsyncMock
-            ) as mock_details_func,
-        ):
-            mock_headers.return_value = {
-                "accept": "application/json",
-                "Authorization": "Bearer test",
-            }
-            mock_details_func.side_effect = NotFoundError(
-                "Movie with ID 999999 not found", "Movie", 999999
-            )
-
-            response = test_client.post("/details", json=details_data)
-
-            assert response.status_code == 404
-            data = response.json()
-            assert "error" in data
-            assert "not found" in str(data["error"]).lower()
-
-    def test_details_invalid_content_id(self, test_client: TestClient):
-        """Test details with invalid content ID."""
-        details_data = {
-            "content_id": -1,
-            "type_of_content": "Movie",
-            "option_language": "en-US",
-        }
+        mock_get_details.side_effect = NotFoundError(
+            "Movie with ID 999999 not found", "Movie", 999999
+        )
 
-        response = test_client.post("/details", json=details_data)
+        response = await async_client.post("/details", json=details_data)
 
-        assert response.status_code == 400  # Validation error
+        assert response.status_code == 404
+        data = response.json()
+        assert "error" in data
+        assert "not found" in str(data["error"]).lower()
 
-    def test_details_invalid_content_type(self, test_client: TestClient):
-        """Test details with invalid content type."""
-        details_data = {
-            "content_id": 27205,
-            "type_of_content": "Invalid",
-            "option_language": "en-US",
-        }
+    async def test_details_invalid_content_id(self, async_client: AsyncClient):
+        """Test details with invalid content ID."""
+        details_data = {**_BASE_MOVIE_REQUEST, "content_id": -1}
 
-        response = test_client.post("/details", json=details_data)
+        response = await async_client.post("/details", json=details_data)
 
         assert response.status_code == 400  # Validation error
+        data = response.json()
+        assert data["error"]["code"] == "VALIDATION_ERROR"
+        assert data["error"]["details"]["field"] == "content_id"
 
 
 class TestMiddleware:
@@ -417,30 +358,23 @@ class TestMiddleware:
 class TestErrorHandling:
     """Test error handling and responses."""
 
-    def test_authentication_error(self, test_client: TestClient):
+    def test_authentication_error(self, test_client: TestClient, mock_get_headers):
         """Test authentication error handling."""
-        with patch("app.main.get_headers") as mock_headers:
-            mock_headers.side_effect = AuthenticationError("Invalid API key")
+        mock_get_headers.side_effect = AuthenticationError("Invalid API key")
 
-            search_data = {
-                "text_search": "test",
-                "type_of_content": "Movie",
-                "option_language": "en-US",
-            }
+        search_data = {**_BASE_MOVIE_REQUEST, "text_search": "test"}
 
-            response = test_client.post("/search", json=search_data)
+        response = test_client.post("/search", json=search_data)
 
-            assert response.status_code == 401
-            data = response.json()
-            assert "error" in data
+        assert response.status_code == 401
+        data = response.json()
+        assert "error" in data
+        assert data["error"]["code"] == "AUTHENTICATION_ERROR"
+        assert data["error"]["details"] == {}
 
     def test_validation_error(self, test_client: TestClient):
         """Test validation error handling."""
-        search_data = {
-            "text_search": "a" * 1000,  # Too long
-            "type_of_content": "Movie",
-            "option_language": "en-US",
-        }
+        search_data = {**_BASE_MOVIE_REQUEST, "text_search": _MEDIUM_TEXT}
 
         response = test_client.post("/search", json=search_data)
 
@@ -458,64 +392,57 @@ class TestErrorHandling:
 class TestRateLimiting:
     """Test rate limiting functionality."""
 
-    def test_rate_limiting(self, test_client: TestClient):
+    @pytest.mark.anyio
+    async def test_rate_limiting(self, async_client: AsyncClient):
         """Test that rate limiting is applied."""
-        # Make multiple rapid requests
-        responses = []
-        for _ in range(10):
-            response = test_client.get("/health")
-            responses.append(response)
+        # Make multiple concurrent requests through the middleware
+        responses = await asyncio.gather(
+            *(async_client.get("/health") for _ in range(10))
+        )
 
         # All should succeed (rate limiting might be generous for tests)
         # but we can check that the middleware is working
         assert all(r.status_code == 200 for r in responses)
+        assert all("X-Process-Time" in r.headers for r in responses)
+
+    def test_rate_limit_exceeded(self, test_client: TestClient):
+        """Test a client over its limit gets a 429 error response."""
+        # A client address of its own, so other tests keep their tokens
+        headers = {"X-Forwarded-For": "198.51.100.7"}
+        for _ in range(rate_limiter.requests_per_minute):
+            assert test_client.get("/health", headers=headers).status_code == 200
+
+        response = test_client.get("/health", headers=headers)
+
+        assert response.status_code == 429
+        assert response.json()["error"]["code"] == "RATE_LIMIT_ERROR"
 
 
+@pytest.mark.usefixtures("_patched_get_headers")
 class TestInputSanitization:
     """Test input sanitization and validation."""
 
-    def test_sql_injection_attempt(self, test_client: TestClient):
+    def test_sql_injection_attempt(self, test_client: TestClient, mock_search):
         """Test SQL injection attempt is sanitized."""
-        search_data = {
-            "text_search": "'; DROP TABLE users; --",
-            "type_of_content": "Movie",
-            "option_language": "en-US",
-        }
+        search_data = {**_BASE_MOVIE_REQUEST, "text_search": "'; DROP TABLE users; --"}
 
-        with (
-            patch("app.main.get_headers") as mock_headers,
-            patch("app.main.search_movies", new_callable=AsyncMock) as mock_search,
-        ):
-            mock_headers.return_value = {
-                "accept": "application/json",
-                "Authorization": "Bearer test",
-            }
-            mock_search.return_value = []
+        mock_search.return_value = []
 
-            response = test_client.post("/search", json=search_data)
+        response = test_client.post("/search", json=search_data)
 
-            # Should either accept sanitized input or reject it
-            assert response.status_code in [200, 400]
+        # Should either accept sanitized input or reject it
+        assert response.status_code in [200, 400]
 
-    def test_xss_attempt(self, test_client: TestClient):
+    def test_xss_attempt(self, test_client: TestClient, mock_search):
         """Test XSS attempt is sanitized."""
         search_data = {
+            **_BASE_MOVIE_REQUEST,
             "text_search": "<script>alert('xss')</script>",
-            "type_of_content": "Movie",
-            "option_language": "en-US",
         }
 
-        with (
-            patch("app.main.get_headers") as mock_headers,
-            patch("app.main.search_movies", new_callable=AsyncMock) as mock_search,
-        ):
-            mock_headers.return_value = {
-                "accept": "application/json",
-                "Authorization": "Bearer test",
-            }
-            mock_search.return_value = []
+        mock_search.return_value = []
 
-            response = test_client.post("/search", json=search_data)
+        response = test_client.post("/search", json=search_data)
 
-            # Should either accept sanitized input or reject it
-            assert response.status_code in [200, 400]
+        # Should either accept sanitized input or reject it
+        assert response.status_code in [200, 400]
@@ -0,0 +1 @@
+"""Application module tests."""
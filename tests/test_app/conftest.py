@@ -0,0 +1,38 @@
+"""Fixtures shared by the application module tests."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.cache import availability_cache, tmdb_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Start every test with empty shared caches."""
+    tmdb_cache.clear()
+    availability_cache.clear()
+    yield
+    tmdb_cache.clear()
+    availability_cache.clear()
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Return a helper that swaps a module's clock for one the test advances.
+
+    Only the module's ``time`` attribute is patched, so the event loop keeps
+    the real monotonic clock.
+    """
+
+    def install(module, now=1000.0):
+        fake = SimpleNamespace(now=now)
+        monkeypatch.setattr(
+            module,
+            "time",
+            SimpleNamespace(monotonic=lambda: fake.now, time=time.time),
+        )
+        return fake
+
+    return install
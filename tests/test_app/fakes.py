@@ -0,0 +1,51 @@
+"""Fake aiohttp objects for exercising outgoing requests without a network."""
+
+from contextlib import asynccontextmanager
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    def __init__(self, status, headers=None, body=b"{}"):
+        """Store the canned status, headers and body."""
+        self.status = status
+        self.headers = headers or {}
+        self.body = body
+
+    async def read(self):
+        """Return the canned body."""
+        return self.body
+
+
+class FakeSession:
+    """Session replaying canned responses (or raising errors) in order.
+
+    Every request is recorded in ``requests`` as ``(method, url, kwargs)``.
+    """
+
+    def __init__(self, *outcomes):
+        """Queue the responses or exceptions returned by successive requests."""
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    @property
+    def calls(self):
+        """Number of requests made so far."""
+        return len(self.requests)
+
+    @asynccontextmanager
+    async def _request(self, method, url, kwargs):
+        """Record the request and return the next canned outcome."""
+        self.requests.append((method, url, kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        yield outcome
+
+    def get(self, url, **kwargs):
+        """Fake a GET request."""
+        return self._request("GET", url, kwargs)
+
+    def head(self, url, **kwargs):
+        """Fake a HEAD request."""
+        return self._request("HEAD", url, kwargs)
@@ -0,0 +1,109 @@
+"""Tests for the in-process TTL cache."""
+
+import asyncio
+
+import pytest
+
+from app import cache as cache_module
+from app.cache import TTLCache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def clock(fake_clock):
+    """Clock driving the cache's entry expiry."""
+    return fake_clock(cache_module)
+
+
+def counting_fetcher(*values):
+    """Build a fetcher returning ``values`` in turn and counting its calls."""
+    calls = []
+
+    async def fetch():
+        calls.append(None)
+        return values[len(calls) - 1]
+
+    return fetch, calls
+
+
+async def test_concurrent_misses_share_one_fetch():
+    """Test concurrent misses on one key call the fetcher once."""
+    cache = TTLCache()
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(None)
+        await release.wait()
+        return "value"
+
+    waiters = [
+        asyncio.ensure_future(cache.get_or_set("key", fetch, ttl=60)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["value"] * 5
+    assert len(calls) == 1
+    assert "key" not in cache._inflight
+
+
+async def test_expired_entry_is_refetched(clock):
+    """Test an entry past its TTL is fetched again."""
+    cache = TTLCache()
+    fetch, calls = counting_fetcher("old", "new")
+
+    assert await cache.get_or_set("key", fetch, ttl=60) == "old"
+    clock.now += 60
+
+    assert await cache.get_or_set("key", fetch, ttl=60) == "new"
+    assert len(calls) == 2
+
+
+def test_oldest_key_evicted_at_maxsize():
+    """Test the least recently used key is evicted once the cache is full."""
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+async def test_stale_hit_refreshes_once_in_background(clock):
+    """Test a hit near expiry returns the old value and refreshes it once."""
+    cache = TTLCache()
+    fetch, calls = counting_fetcher("old", "new")
+    await cache.get_or_set("key", fetch, ttl=10)
+
+    clock.now += 9
+    assert await cache.get_or_set("key", fetch, ttl=10) == "old"
+    assert await cache.get_or_set("key", fetch, ttl=10) == "old"
+
+    await cache._inflight["key"]
+    assert len(calls) == 2
+    assert cache.get("key") == "new"
+
+
+async def test_failed_fetch_is_not_cached():
+    """Test a fetcher error reaches the caller and leaves nothing behind."""
+    cache = TTLCache()
+
+    async def fail():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_set("key", fail, ttl=60)
+
+    assert cache.get("key") is None
+    assert "key" not in cache._inflight
+
+    fetch, calls = counting_fetcher("value")
+    assert await cache.get_or_set("key", fetch, ttl=60) == "value"
+    assert len(calls) == 1
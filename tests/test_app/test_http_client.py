@@ -0,0 +1,97 @@
+"""Tests for the shared HTTP client and its retry policy."""
+
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+
+from app.http_client import (
+    REQUEST_TIMEOUT,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    close_session,
+    get_session,
+    get_with_retry,
+)
+from tests.test_app.fakes import FakeResponse, FakeSession
+
+pytestmark = pytest.mark.anyio
+
+_URL = "https://api.themoviedb.org/3/movie/27205"
+
+
+@pytest.fixture
+def mock_sleep():
+    """Patch the backoff sleep so retries run instantly."""
+    with patch("app.http_client.asyncio.sleep", new_callable=AsyncMock) as mock:
+        yield mock
+
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+async def test_retries_retryable_status(mock_sleep, status):
+    """Test rate limits and server errors are retried until success."""
+    session = FakeSession(FakeResponse(status), FakeResponse(200, body=b"ok"))
+
+    assert await get_with_retry(session, _URL) == (200, b"ok")
+    assert session.calls == 2
+    mock_sleep.assert_awaited_once()
+    # Full jitter: the first delay is drawn from [0, base delay]
+    assert 0 <= mock_sleep.await_args.args[0] <= RETRY_BASE_DELAY
+
+
+async def test_retries_network_error(mock_sleep):
+    """Test connection errors are retried."""
+    session = FakeSession(aiohttp.ClientConnectionError(), FakeResponse(200))
+
+    status, _ = await get_with_retry(session, _URL)
+
+    assert status == 200
+    assert session.calls == 2
+
+
+async def test_gives_up_after_max_attempts(mock_sleep):
+    """Test the last response is returned once the attempts are used up."""
+    session = FakeSession(*(FakeResponse(503) for _ in range(RETRY_ATTEMPTS)))
+
+    status, _ = await get_with_retry(session, _URL)
+
+    assert status == 503
+    assert session.calls == RETRY_ATTEMPTS
+    assert mock_sleep.await_count == RETRY_ATTEMPTS - 1
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "expected_delay"),
+    [("2", 2.0), ("30", RETRY_MAX_DELAY)],
+    ids=["honoured", "capped"],
+)
+async def test_retry_after(mock_sleep, retry_after, expected_delay):
+    """Test Retry-After sets the delay, capped at the maximum backoff."""
+    session = FakeSession(
+        FakeResponse(429, headers={"Retry-After": retry_after}), FakeResponse(200)
+    )
+
+    await get_with_retry(session, _URL)
+
+    mock_sleep.assert_awaited_once_with(expected_delay)
+
+
+@pytest.mark.parametrize("status", [400, 401, 404])
+async def test_no_retry_on_client_error(mock_sleep, status):
+    """Test client errors are returned without retrying."""
+    session = FakeSession(FakeResponse(status))
+
+    result_status, _ = await get_with_retry(session, _URL)
+
+    assert result_status == status
+    assert session.calls == 1
+    mock_sleep.assert_not_awaited()
+
+
+async def test_session_has_request_timeout():
+    """Test the shared session bounds every request with a timeout."""
+    try:
+        assert get_session().timeout == REQUEST_TIMEOUT
+    finally:
+        await close_session()
@@ -0,0 +1,43 @@
+"""Tests for the background log listener."""
+
+import logging
+import logging.config
+from logging.handlers import QueueHandler
+
+import pytest
+from fastapi.testclient import TestClient
+from uvicorn.config import LOGGING_CONFIG
+
+from app.main import app
+from tests.conftest import TEST_TMDB_API_KEY
+
+_UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+
+@pytest.fixture
+def uvicorn_logging(monkeypatch):
+    """Apply uvicorn's default logging config, restoring the loggers after."""
+    loggers = [logging.getLogger(name) for name in _UVICORN_LOGGERS]
+    saved = [(log, list(log.handlers), log.level, log.propagate) for log in loggers]
+    monkeypatch.setattr("app.main.TMDB_API_KEY", TEST_TMDB_API_KEY)
+    logging.config.dictConfig(LOGGING_CONFIG)
+    yield
+    for log, handlers, level, propagate in saved:
+        log.handlers[:] = handlers
+        log.setLevel(level)
+        log.propagate = propagate
+
+
+@pytest.mark.usefixtures("uvicorn_logging")
+def test_listener_installed_under_default_uvicorn_config():
+    """Test startup queues the handlers uvicorn puts on its parent logger."""
+    uvicorn_logger = logging.getLogger("uvicorn")
+    original_handlers = list(uvicorn_logger.handlers)
+    assert original_handlers
+
+    with TestClient(app):
+        assert len(uvicorn_logger.handlers) == 1
+        assert isinstance(uvicorn_logger.handlers[0], QueueHandler)
+
+    # Shutdown hands the original handlers back
+    assert uvicorn_logger.handlers == original_handlers
@@ -0,0 +1,74 @@
+"""Tests for application startup and the endpoint dependency providers."""
+
+from types import MappingProxyType
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main, movies, series
+from app.errors import AuthenticationError
+from app.main import (
+    get_details_functions,
+    get_headers,
+    get_search_functions,
+    get_stream_functions,
+)
+from tests.conftest import TEST_TMDB_API_KEY
+
+pytestmark = pytest.mark.anyio
+
+_EXPECTED_HEADERS = {
+    "accept": "application/json",
+    "Authorization": f"Bearer {TEST_TMDB_API_KEY}",
+}
+
+
+@pytest.fixture
+def unset_headers(monkeypatch):
+    """Start with no TMDB headers built and the test API key configured."""
+    monkeypatch.setattr("app.main.TMDB_API_KEY", TEST_TMDB_API_KEY)
+    monkeypatch.setattr("app.main.TMDB_HEADERS", MappingProxyType({}))
+
+
+@pytest.mark.usefixtures("unset_headers")
+def test_startup_sets_tmdb_headers():
+    """Test startup builds the TMDB headers from the API key."""
+    with TestClient(main.app):
+        assert main.TMDB_HEADERS == _EXPECTED_HEADERS
+
+
+@pytest.mark.usefixtures("unset_headers")
+def test_headers_built_on_first_use_without_startup():
+    """Test header lookup builds the headers when startup did not run."""
+    assert get_headers() == _EXPECTED_HEADERS
+
+
+@pytest.mark.usefixtures("unset_headers")
+def test_headers_without_api_key_raise(monkeypatch):
+    """Test header lookup refuses to return empty headers."""
+    monkeypatch.setattr("app.main.TMDB_API_KEY", None)
+
+    with pytest.raises(AuthenticationError):
+        get_headers()
+
+
+@pytest.mark.parametrize(
+    ("provider", "expected"),
+    [
+        (
+            get_search_functions,
+            {"Movie": movies.search_movies, "Series": series.search_series},
+        ),
+        (
+            get_stream_functions,
+            {"Movie": movies.stream_movies, "Series": series.stream_series},
+        ),
+        (
+            get_details_functions,
+            {"Movie": movies.get_movie_details, "Series": series.get_series_details},
+        ),
+    ],
+)
+async def test_providers_map_content_types(provider, expected):
+    """Test each provider maps every content type to its module function."""
+    assert await provider() == expected
@@ -0,0 +1,73 @@
+"""Tests for movie details."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.movies import get_movie_details, movie_page_results
+
+pytestmark = pytest.mark.anyio
+
+# Fields of a /details response for a movie
+_MOVIE_DETAILS_KEYS = {
+    "id",
+    "url",
+    "is_available",
+    "original_title",
+    "overview",
+    "release_date",
+    "vote_average",
+    "vote_count",
+    "runtime",
+    "genres",
+    "poster",
+    "backdrop_path",
+    "budget",
+    "revenue",
+    "status",
+}
+
+
+@pytest.mark.parametrize(
+    ("is_available", "expected_url"),
+    [(True, "https://vixsrc.to/movie/27205"), (False, None)],
+    ids=["available", "unavailable"],
+)
+async def test_movie_details_shape(sample_movie_data, is_available, expected_url):
+    """Test details combine TMDB data with the streaming availability."""
+    with (
+        patch("app.movies.get_session", MagicMock()),
+        patch(
+            "app.movies.fetch_movie_details",
+            AsyncMock(return_value=sample_movie_data),
+        ),
+        patch(
+            "app.movies.check_url_exists_async",
+            AsyncMock(return_value=is_available),
+        ),
+    ):
+        details = await get_movie_details(27205, "en-US", {})
+
+    assert set(details) == _MOVIE_DETAILS_KEYS
+    assert details["is_available"] is is_available
+    assert details["url"] == expected_url
+    assert details["genres"] == ["Action", "Sci-Fi"]
+    assert details["poster"] == (
+        "https://image.tmdb.org/t/p/w500/9gk7adHYeDvHkCSEqAvQNLV5Uge.jpg"
+    )
+
+
+def test_movie_page_results_summaries(sample_movie_data):
+    """Test each search result is reduced to its basic information."""
+    assert movie_page_results(1, {"results": [sample_movie_data]}) == [
+        {
+            "id": 27205,
+            "original_title": "Inception",
+            "overview": sample_movie_data["overview"],
+            "release_date": "2010-07-16",
+            "vote_average": 8.4,
+            "poster": (
+                "https://image.tmdb.org/t/p/w500/9gk7adHYeDvHkCSEqAvQNLV5Uge.jpg"
+            ),
+        }
+    ]
@@ -0,0 +1,92 @@
+"""Tests for the rate limiter and input sanitization."""
+
+import pytest
+
+from app import security
+from app.security import RateLimiter, sanitize_input
+
+_LIMIT = 5
+_CLIENT = "203.0.113.1"
+
+
+@pytest.fixture
+def clock(fake_clock):
+    """Clock driving the security module's rate limiter."""
+    return fake_clock(security)
+
+
+@pytest.fixture
+def limiter(clock):
+    """Rate limiter allowing a burst of ``_LIMIT`` requests."""
+    return RateLimiter(requests_per_minute=_LIMIT)
+
+
+def test_burst_allowed_then_denied(limiter):
+    """Test a full bucket allows a burst of the limit and no more."""
+    assert all(limiter.is_allowed(_CLIENT) for _ in range(_LIMIT))
+    assert limiter.is_allowed(_CLIENT) is False
+
+
+def test_clients_have_separate_buckets(limiter):
+    """Test one client exhausting its bucket does not limit another."""
+    for _ in range(_LIMIT):
+        limiter.is_allowed(_CLIENT)
+
+    assert limiter.is_allowed("203.0.113.2") is True
+
+
+def test_token_refills_after_interval(limiter, clock):
+    """Test one token comes back every window / limit seconds."""
+    for _ in range(_LIMIT):
+        limiter.is_allowed(_CLIENT)
+
+    clock.now += limiter.window / _LIMIT
+
+    assert limiter.is_allowed(_CLIENT) is True
+    assert limiter.is_allowed(_CLIENT) is False
+
+
+def test_denied_request_spends_no_token(limiter, clock):
+    """Test denied requests do not delay the next refill."""
+    for _ in range(_LIMIT):
+        limiter.is_allowed(_CLIENT)
+    for _ in range(3):
+        assert limiter.is_allowed(_CLIENT) is False
+
+    clock.now += limiter.window / _LIMIT
+
+    assert limiter.is_allowed(_CLIENT) is True
+
+
+def test_idle_buckets_swept(limiter, clock):
+    """Test buckets idle for a whole window are dropped on the next sweep."""
+    limiter.is_allowed(_CLIENT)
+    clock.now += limiter.window / 2
+    limiter.is_allowed("203.0.113.2")
+
+    clock.now += limiter.window / 2 + 1
+    limiter.is_allowed("203.0.113.3")
+
+    assert _CLIENT not in limiter.buckets
+    assert "203.0.113.2" in limiter.buckets
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("<b>Tom & Jerry</b>", "bTom  Jerry/b"),
+        ("<script>alert('xss')</script>", "alert(xss)/"),
+        ("javascript:alert(1)", "java:alert(1)"),
+        # One pass per keyword: the nested keyword is only unwrapped once
+        ("scrscriptipt", "script"),
+        # Matching is case-sensitive, so capitalized titles are untouched
+        ("The Script", "The Script"),
+        ("JavaScript SCRIPT", "JavaScript SCRIPT"),
+        ("Manuscript", "Manu"),
+        ("  Inception  ", "Inception"),
+        ("", ""),
+    ],
+)
+def test_sanitize_input(text, expected):
+    """Test dangerous characters and lowercase keywords are stripped."""
+    assert sanitize_input(text) == expected
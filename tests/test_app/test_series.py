@@ -0,0 +1,172 @@
+"""Tests for series availability probing and details."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.series import (
+    MAX_CONCURRENT_PROBES,
+    get_series_details,
+    search_series_data_async,
+    series_page_results,
+)
+
+pytestmark = pytest.mark.anyio
+
+# Fields of a /details response for a series
+_SERIES_DETAILS_KEYS = {
+    "id",
+    "name",
+    "air_date",
+    "vote_avg",
+    "overview",
+    "poster",
+    "is_available",
+    "valid_seasons",
+    "valid_episodes",
+    "stream_url_template",
+    "number_of_seasons",
+    "number_of_episodes",
+    "status",
+    "genres",
+    "backdrop_path",
+    "first_air_date",
+    "last_air_date",
+    "vote_count",
+    "popularity",
+}
+
+
+def make_series(episode_counts):
+    """Build TMDB series data with the given episodes per season."""
+    return {
+        "id": 1396,
+        "number_of_seasons": len(episode_counts),
+        "seasons": [
+            {"season_number": season, "episode_count": count}
+            for season, count in enumerate(episode_counts, start=1)
+        ],
+    }
+
+
+def available(*episodes):
+    """Build a probe fake that finds exactly the given (season, episode) pairs."""
+    urls = {f"https://vixsrc.to/tv/1396/{season}/{ep}" for season, ep in episodes}
+
+    async def probe(session, url):
+        return url in urls
+
+    return AsyncMock(side_effect=probe)
+
+
+async def test_no_first_episode_skips_remaining_probes():
+    """Test a series without any episode 1 only probes episode 1 per season."""
+    probe = available()
+
+    with patch("app.series.check_url_exists_async", probe):
+        result = await search_series_data_async(
+            None, make_series([10, 10, 10]), "en-US", {}
+        )
+
+    assert result == ([], {})
+    assert probe.await_count == 3
+    probed = {call.args[1] for call in probe.await_args_list}
+    assert probed == {f"https://vixsrc.to/tv/1396/{season}/1" for season in (1, 2, 3)}
+
+
+async def test_only_open_seasons_are_probed_further():
+    """Test seasons missing episode 1 are neither listed nor probed further."""
+    probe = available((1, 1), (1, 2), (1, 3), (2, 2))
+
+    with patch("app.series.check_url_exists_async", probe):
+        result = await search_series_data_async(
+            None, make_series([10, 10]), "en-US", {}
+        )
+
+    assert result == ([1], {1: [1, 2, 3]})
+    # Episode 1 of both seasons, then episodes 2-10 of season 1
+    assert probe.await_count == 2 + 9
+
+
+async def test_probe_concurrency_is_capped():
+    """Test no more than MAX_CONCURRENT_PROBES probes run at once."""
+    in_flight = 0
+    peak = 0
+
+    async def probe(session, url):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return True
+
+    with patch("app.series.check_url_exists_async", side_effect=probe):
+        valid_seasons, valid_episodes = await search_series_data_async(
+            None, make_series([100]), "en-US", {}
+        )
+
+    assert valid_seasons == [1]
+    assert valid_episodes[1] == list(range(1, 101))
+    assert peak <= MAX_CONCURRENT_PROBES
+
+
+async def test_series_details_stream_url_template():
+    """Test details expose a URL template and the streamable episodes."""
+    series_data = {
+        **make_series([3, 2]),
+        "original_name": "Breaking Bad",
+        "first_air_date": "2008-01-20",
+        "vote_average": 9.5,
+        "overview": "When an unassuming chemistry teacher...",
+    }
+    probe = available((1, 1), (1, 2), (2, 1))
+
+    with (
+        patch("app.series.get_session", MagicMock()),
+        patch("app.series.fetch_series_details", AsyncMock(return_value=series_data)),
+        patch("app.series.check_url_exists_async", probe),
+    ):
+        details = await get_series_details(1396, "en-US", {})
+
+    assert set(details) == _SERIES_DETAILS_KEYS
+    template = details["stream_url_template"]
+    assert template == "https://vixsrc.to/tv/1396/{season}/{episode}"
+    assert "streaming_urls" not in details
+    assert details["is_available"] is True
+    assert details["valid_seasons"] == [1, 2]
+    assert details["valid_episodes"] == {1: [1, 2], 2: [1]}
+    # Filling the template gives back the URLs that were found
+    assert template.format(season=1, episode=2) in {
+        call.args[1] for call in probe.await_args_list
+    }
+
+
+def test_series_page_results_summaries():
+    """Test each search result is reduced to its basic information."""
+    page_data = {
+        "results": [
+            {
+                "id": 1396,
+                "original_name": "Breaking Bad",
+                "first_air_date": "2008-01-20",
+                "vote_average": 9.5,
+                "overview": "When an unassuming chemistry teacher...",
+                "poster_path": "/ggFHVNu6YYI5L9pCfOacjizRGt.jpg",
+                "popularity": 400.0,
+            }
+        ]
+    }
+
+    assert series_page_results(1, page_data) == [
+        {
+            "id": 1396,
+            "name": "Breaking Bad",
+            "air_date": "2008-01-20",
+            "vote_avg": 9.5,
+            "overview": "When an unassuming chemistry teacher...",
+            "poster": "https://image.tmdb.org/t/p/w500/ggFHVNu6YYI5L9pCfOacjizRGt.jpg",
+        }
+    ]
+    assert series_page_results(1, {"results": []}) == []
@@ -0,0 +1,69 @@
+"""Tests for the vixsrc URL probe."""
+
+import aiohttp
+import pytest
+
+from app.cache import availability_cache
+from app.utils import check_url_exists_async
+from tests.test_app.fakes import FakeResponse, FakeSession
+
+pytestmark = pytest.mark.anyio
+
+_URL = "https://vixsrc.to/movie/27205"
+_CACHE_KEY = f"vix:url:{_URL}"
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"), [(200, True), (404, False)], ids=["found", "missing"]
+)
+async def test_head_status_decides_and_is_cached(status, expected):
+    """Test a HEAD answer is used directly and remembered."""
+    session = FakeSession(FakeResponse(status))
+
+    assert await check_url_exists_async(session, _URL) is expected
+    assert [method for method, _, _ in session.requests] == ["HEAD"]
+    assert session.requests[0][2]["allow_redirects"] is True
+    assert availability_cache.get(_CACHE_KEY) is expected
+
+
+async def test_cached_result_skips_request():
+    """Test a remembered result is returned without probing."""
+    availability_cache.set(_CACHE_KEY, True, ttl=60)
+    session = FakeSession()
+
+    assert await check_url_exists_async(session, _URL) is True
+    assert session.calls == 0
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"), [(206, True), (200, True), (404, False)]
+)
+async def test_head_refused_falls_back_to_range_get(status, expected):
+    """Test a 405 on HEAD retries with a first-byte GET."""
+    session = FakeSession(FakeResponse(405), FakeResponse(status))
+
+    assert await check_url_exists_async(session, _URL) is expected
+    method, _, kwargs = session.requests[1]
+    assert method == "GET"
+    assert kwargs["headers"] == {"Range": "bytes=0-0"}
+    assert availability_cache.get(_CACHE_KEY) is expected
+
+
+async def test_server_error_is_not_cached():
+    """Test a 5xx reports the URL missing without remembering it."""
+    session = FakeSession(FakeResponse(503), FakeResponse(200))
+
+    assert await check_url_exists_async(session, _URL) is False
+    assert availability_cache.get(_CACHE_KEY) is None
+
+    # The next probe asks the server again
+    assert await check_url_exists_async(session, _URL) is True
+    assert session.calls == 2
+
+
+async def test_network_error_is_not_cached():
+    """Test a failed request reports the URL missing without remembering it."""
+    session = FakeSession(aiohttp.ClientConnectionError())
+
+    assert await check_url_exists_async(session, _URL) is False
+    assert availability_cache.get(_CACHE_KEY) is None